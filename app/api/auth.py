@@ -1,5 +1,5 @@
-from typing import Dict, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 import logging
@@ -47,34 +47,39 @@ from app.config.settings import settings
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Shared dependency markers, reused by every route below
+_DB_DEP = Depends(get_db)
+_USER_DEP = Depends(validate_two_factor_auth)
 
-def get_cookie_settings(token_type: str) -> Dict[str, str]:
-    """
-    Get cookie settings based on token type.
-    """
-    is_secure = str(settings.PUBLIC_URL).startswith("https://")
-    
-    if token_type == "access":
-        # 15 minutes
-        max_age = 15 * 60
-    else:
-        # 2 days
-        max_age = 2 * 24 * 60 * 60
-    
-    return {
-        "key": "Authentication" if token_type == "access" else "Refresh",
-        "httponly": True,
-        "samesite": "strict",
-        "secure": is_secure,
-        "max_age": max_age
-    }
+
+# Cookie settings never change at runtime, so build them once
+_IS_SECURE_COOKIE = settings.public_url.startswith("https://")
+
+_ACCESS_COOKIE = {
+    "key": "Authentication",
+    "httponly": True,
+    "samesite": "strict",
+    "secure": _IS_SECURE_COOKIE,
+    # 15 minutes
+    "max_age": 15 * 60
+}
+
+_REFRESH_COOKIE = {
+    "key": "Refresh",
+    "httponly": True,
+    "samesite": "strict",
+    "secure": _IS_SECURE_COOKIE,
+    # 2 days
+    "max_age": 2 * 24 * 60 * 60
+}
 
 
 @router.post("/register", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
-async def register(
+def register(
     request: RegisterRequest, 
     response: Response,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    db: Session = _DB_DEP
 ):
     """
     Register a new user.
@@ -87,20 +92,18 @@ async def register(
         )
     
     # Register the user
-    user = register_user(db, request)
+    user = register_user(db, request, background_tasks)
     
     # Generate tokens
     tokens = create_auth_tokens(user.id)
-    print(0)
+    
     # Set tokens in cookies
+    response.set_cookie(**_ACCESS_COOKIE, value=tokens["access_token"])
+    response.set_cookie(**_REFRESH_COOKIE, value=tokens["refresh_token"])
     
-    response.set_cookie(**get_cookie_settings("access"), value=tokens["access_token"])
-    print(0)
-    response.set_cookie(**get_cookie_settings("refresh"), value=tokens["refresh_token"])
-    print(0)
     # Save refresh token in database
-    set_refresh_token(db, user.email, tokens["refresh_token"])
-    print(0)
+    set_refresh_token(db, user.id, tokens["refresh_token"])
+    
     # Return user with authentication status
     return {
         "status": "authenticated",
@@ -109,10 +112,10 @@ async def register(
 
 
 @router.post("/login", response_model=AuthResponse)
-async def login(
+def login(
     login_data: LoginRequest, 
     response: Response,
-    db: Session = Depends(get_db)
+    db: Session = _DB_DEP
 ):
     """
     Authenticate a user and return a token.
@@ -131,11 +134,11 @@ async def login(
     tokens = create_auth_tokens(user.id)
     
     # Set tokens in cookies
-    response.set_cookie(**get_cookie_settings("access"), value=tokens["access_token"])
-    response.set_cookie(**get_cookie_settings("refresh"), value=tokens["refresh_token"])
+    response.set_cookie(**_ACCESS_COOKIE, value=tokens["access_token"])
+    response.set_cookie(**_REFRESH_COOKIE, value=tokens["refresh_token"])
     
     # Save refresh token in database
-    set_refresh_token(db, user.email, tokens["refresh_token"])
+    set_refresh_token(db, user.id, tokens["refresh_token"])
     
     # If the user has 2FA enabled, return 2FA required status
     if user.twoFactorEnabled:
@@ -159,10 +162,10 @@ async def auth_providers():
 
 
 @router.post("/refresh", response_model=AuthResponse)
-async def refresh_token(
+def refresh_token(
     request: Request,
     response: Response,
-    db: Session = Depends(get_db)
+    db: Session = _DB_DEP
 ):
     """
     Refresh access token using refresh token.
@@ -179,8 +182,8 @@ async def refresh_token(
     # Validate refresh token
     try:
         # Decode token to get user ID
-        from app.utils.security import decode_token
-        payload = decode_token(refresh_token_cookie, "refresh")
+        from app.utils.security import decode_token_cached
+        payload = decode_token_cached(refresh_token_cookie, "refresh")
         user_id = payload.get("sub")
         is_two_factor_auth = payload.get("is_two_factor_auth", False)
         
@@ -191,11 +194,11 @@ async def refresh_token(
         tokens = create_auth_tokens(user.id, is_two_factor_auth)
         
         # Set tokens in cookies
-        response.set_cookie(**get_cookie_settings("access"), value=tokens["access_token"])
-        response.set_cookie(**get_cookie_settings("refresh"), value=tokens["refresh_token"])
+        response.set_cookie(**_ACCESS_COOKIE, value=tokens["access_token"])
+        response.set_cookie(**_REFRESH_COOKIE, value=tokens["refresh_token"])
         
         # Save refresh token in database
-        set_refresh_token(db, user.email, tokens["refresh_token"])
+        set_refresh_token(db, user.id, tokens["refresh_token"])
         
         # Return authenticated status
         return {
@@ -212,16 +215,16 @@ async def refresh_token(
 
 
 @router.post("/logout", response_model=MessageResponse)
-async def logout(
+def logout(
     response: Response,
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Logout the current user.
     """
     # Clear refresh token in database
-    set_refresh_token(db, user.email, None)
+    set_refresh_token(db, user.id, None)
     
     # Clear cookies
     response.delete_cookie("Authentication")
@@ -231,10 +234,10 @@ async def logout(
 
 
 @router.patch("/password", response_model=MessageResponse)
-async def update_user_password(
+def update_user_password(
     password_data: UpdatePasswordRequest,
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Update user password.
@@ -246,15 +249,16 @@ async def update_user_password(
 
 # Password Recovery Flows
 @router.post("/forgot-password", response_model=MessageResponse, status_code=status.HTTP_200_OK)
-async def forgot_password_endpoint(
+def forgot_password_endpoint(
     forgot_password_data: ForgotPasswordRequest,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    db: Session = _DB_DEP
 ):
     """
     Request a password reset link.
     """
     try:
-        forgot_password(db, forgot_password_data.email)
+        forgot_password(db, forgot_password_data.email, background_tasks)
     except:
         # Ignore errors to prevent email enumeration
         pass
@@ -265,9 +269,9 @@ async def forgot_password_endpoint(
 
 
 @router.post("/reset-password", response_model=MessageResponse, status_code=status.HTTP_200_OK)
-async def reset_password_endpoint(
+def reset_password_endpoint(
     reset_data: ResetPasswordRequest,
-    db: Session = Depends(get_db)
+    db: Session = _DB_DEP
 ):
     """
     Reset password using reset token.
@@ -284,11 +288,11 @@ async def reset_password_endpoint(
 
 # Email Verification Flows
 @router.post("/verify-email", response_model=MessageResponse)
-async def verify_email_endpoint(
+def verify_email_endpoint(
     request: Request,
     # token: str = Query(...),
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Verify email using verification token.
@@ -315,9 +319,10 @@ async def verify_email_endpoint(
 
 
 @router.post("/verify-email/resend", response_model=MessageResponse)
-async def resend_verification_email_endpoint(
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+def resend_verification_email_endpoint(
+    background_tasks: BackgroundTasks,
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Resend verification email.
@@ -328,7 +333,7 @@ async def resend_verification_email_endpoint(
             detail=ErrorMessage.EMAIL_ALREADY_VERIFIED
         )
     
-    send_verification_email(db, user.email)
+    send_verification_email(db, user.email, background_tasks)
     
     return {
         "message": "You should have received a new email with a link to verify your email address."
@@ -337,9 +342,9 @@ async def resend_verification_email_endpoint(
 
 # Two-Factor Authentication Flows
 @router.post("/2fa/setup", response_model=TwoFactorSetupResponse)
-async def setup_two_factor_endpoint(
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+def setup_two_factor_endpoint(
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Setup two-factor authentication.
@@ -349,11 +354,11 @@ async def setup_two_factor_endpoint(
 
 
 @router.post("/2fa/enable", response_model=BackupCodesResponse, status_code=status.HTTP_200_OK)
-async def enable_two_factor_endpoint(
+def enable_two_factor_endpoint(
     two_factor_data: TwoFactorRequest,
     response: Response,
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Enable two-factor authentication.
@@ -364,19 +369,19 @@ async def enable_two_factor_endpoint(
     tokens = create_auth_tokens(user.id, is_two_factor_auth=True)
     
     # Set tokens in cookies
-    response.set_cookie(**get_cookie_settings("access"), value=tokens["access_token"])
-    response.set_cookie(**get_cookie_settings("refresh"), value=tokens["refresh_token"])
+    response.set_cookie(**_ACCESS_COOKIE, value=tokens["access_token"])
+    response.set_cookie(**_REFRESH_COOKIE, value=tokens["refresh_token"])
     
     # Save refresh token in database
-    set_refresh_token(db, user.email, tokens["refresh_token"])
+    set_refresh_token(db, user.id, tokens["refresh_token"])
     
     return {"backup_codes": backup_codes}
 
 
 @router.post("/2fa/disable", response_model=MessageResponse, status_code=status.HTTP_200_OK)
-async def disable_two_factor_endpoint(
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+def disable_two_factor_endpoint(
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Disable two-factor authentication.
@@ -389,11 +394,11 @@ async def disable_two_factor_endpoint(
 
 
 @router.post("/2fa/verify", response_model=UserSchema, status_code=status.HTTP_200_OK)
-async def verify_two_factor_endpoint(
+def verify_two_factor_endpoint(
     two_factor_data: TwoFactorRequest,
     response: Response,
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Verify two-factor authentication code.
@@ -404,21 +409,22 @@ async def verify_two_factor_endpoint(
     tokens = create_auth_tokens(user.id, is_two_factor_auth=True)
     
     # Set tokens in cookies
-    response.set_cookie(**get_cookie_settings("access"), value=tokens["access_token"])
-    response.set_cookie(**get_cookie_settings("refresh"), value=tokens["refresh_token"])
+    response.set_cookie(**_ACCESS_COOKIE, value=tokens["access_token"])
+    response.set_cookie(**_REFRESH_COOKIE, value=tokens["refresh_token"])
     
     # Save refresh token in database
-    set_refresh_token(db, user.email, tokens["refresh_token"])
+    set_refresh_token(db, user.id, tokens["refresh_token"])
     
-    return UserSchema.from_orm(user)
+    # response_model validates and serializes the user once
+    return user
 
 
 @router.post("/2fa/backup", response_model=AuthResponse, status_code=status.HTTP_200_OK)
-async def use_backup_two_factor_endpoint(
+def use_backup_two_factor_endpoint(
     backup_data: TwoFactorBackupRequest,
     response: Response,
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Use backup code for two-factor authentication.
@@ -429,13 +435,13 @@ async def use_backup_two_factor_endpoint(
     tokens = create_auth_tokens(user.id, is_two_factor_auth=True)
     
     # Set tokens in cookies
-    response.set_cookie(**get_cookie_settings("access"), value=tokens["access_token"])
-    response.set_cookie(**get_cookie_settings("refresh"), value=tokens["refresh_token"])
+    response.set_cookie(**_ACCESS_COOKIE, value=tokens["access_token"])
+    response.set_cookie(**_REFRESH_COOKIE, value=tokens["refresh_token"])
     
     # Save refresh token in database
-    set_refresh_token(db, user.email, tokens["refresh_token"])
+    set_refresh_token(db, user.id, tokens["refresh_token"])
     
+    # AuthResponse carries no user, so don't build one just to discard it
     return {
-        "status": "authenticated",
-        "user": UserSchema.from_orm(user)
+        "status": "authenticated"
     }
\ No newline at end of file
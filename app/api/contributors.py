@@ -1,8 +1,10 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+import asyncio
 import httpx
 import logging
-from typing import List
-from pydantic import BaseModel
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from app.config.settings import settings
 
@@ -10,6 +12,21 @@ from app.config.settings import settings
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Contributor lists change rarely, so upstream responses are reused for a while
+CONTRIBUTORS_CACHE_TTL = 10 * 60  # seconds
+# Failed fetches are cached briefly so an upstream outage isn't retried by every queued request
+CONTRIBUTORS_FAILURE_TTL = 30  # seconds
+_cache: Dict[str, Tuple[float, bytes]] = {}
+# One lock per key, so a slow GitHub refresh never blocks Crowdin
+_cache_locks: Dict[str, asyncio.Lock] = {}
+
+# Shared client so upstream calls reuse pooled HTTP/2 connections
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=10,
+    limits=httpx.Limits(max_keepalive_connections=20)
+)
+
 
 class Contributor(BaseModel):
     """
@@ -21,76 +38,135 @@ class Contributor(BaseModel):
     avatar: str
 
 
-@router.get("/github", response_model=List[Contributor])
-async def get_github_contributors():
+_contributors_adapter = TypeAdapter(List[Contributor])
+
+
+async def close_http_client() -> None:
     """
-    Get GitHub contributors.
+    Close the shared HTTP client on application shutdown.
+    """
+    await _client.aclose()
+
+
+async def _get_cached(
+    key: str,
+    fetch: Callable[[], Awaitable[Optional[List[Dict[str, Any]]]]]
+) -> bytes:
+    """
+    Return the cached contributors for key as JSON, refreshing them when expired.
+    Contributors are validated and serialized once per refresh, so cache hits
+    skip response validation entirely. A failed fetch caches an empty list for
+    CONTRIBUTORS_FAILURE_TTL, so requests queued behind it return at once
+    instead of each retrying upstream.
+    """
+    entry = _cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    
+    async with _cache_locks.setdefault(key, asyncio.Lock()):
+        # Another request may have refreshed the entry while we waited
+        entry = _cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        
+        contributors = await fetch()
+        content = None
+        if contributors is not None:
+            try:
+                content = _contributors_adapter.dump_json(_contributors_adapter.validate_python(contributors))
+            except ValidationError as e:
+                logger.error(f"Invalid {key} contributors response: {e}")
+        
+        if content is None:
+            _cache[key] = (time.monotonic() + CONTRIBUTORS_FAILURE_TTL, b"[]")
+            return b"[]"
+        
+        _cache[key] = (time.monotonic() + CONTRIBUTORS_CACHE_TTL, content)
+        return content
+
+
+async def _fetch_github_contributors() -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch contributors from the GitHub API.
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.github.com/repos/AmruthPillai/Reactive-Resume/contributors", 
-                timeout=10
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"GitHub API error: {response.status_code} {response.text}")
-                return []
-            
-            data = response.json()
-            
-            # Limit to first 20 contributors
-            contributors = data[:20]
-            
-            return [
-                {
-                    "id": user["id"],
-                    "name": user["login"],
-                    "url": user["html_url"],
-                    "avatar": user["avatar_url"]
-                }
-                for user in contributors
-            ]
+        response = await _client.get(
+            "https://api.github.com/repos/AmruthPillai/Reactive-Resume/contributors"
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"GitHub API error: {response.status_code} {response.text}")
+            return None
+        
+        data = response.json()
+        
+        # Limit to first 20 contributors
+        contributors = data[:20]
+        
+        return [
+            {
+                "id": user["id"],
+                "name": user["login"],
+                "url": user["html_url"],
+                "avatar": user["avatar_url"]
+            }
+            for user in contributors
+        ]
     except Exception as e:
         logger.error(f"Error fetching GitHub contributors: {e}")
-        return []
+        return None
 
 
-@router.get("/crowdin", response_model=List[Contributor])
-async def get_crowdin_contributors():
+async def _fetch_crowdin_contributors() -> Optional[List[Dict[str, Any]]]:
     """
-    Get Crowdin contributors.
+    Fetch contributors from the Crowdin API.
     """
     try:
         # Check if Crowdin credentials are set
         if not settings.CROWDIN_PROJECT_ID or not settings.CROWDIN_PERSONAL_TOKEN:
             return []
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://api.crowdin.com/api/v2/projects/{settings.CROWDIN_PROJECT_ID}/members",
-                headers={"Authorization": f"Bearer {settings.CROWDIN_PERSONAL_TOKEN}"},
-                timeout=10
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Crowdin API error: {response.status_code} {response.text}")
-                return []
-            
-            data = response.json()
-            
-            # Limit to first 20 contributors
-            contributors = data.get("data", [])[:20]
-            
-            return [
-                {
-                    "id": item["data"]["id"],
-                    "name": item["data"]["username"],
-                    "url": f"https://crowdin.com/profile/{item['data']['username']}",
-                    "avatar": item["data"]["avatarUrl"]
-                }
-                for item in contributors
-            ]
+        response = await _client.get(
+            f"https://api.crowdin.com/api/v2/projects/{settings.CROWDIN_PROJECT_ID}/members",
+            headers={"Authorization": f"Bearer {settings.CROWDIN_PERSONAL_TOKEN}"}
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"Crowdin API error: {response.status_code} {response.text}")
+            return None
+        
+        data = response.json()
+        
+        # Limit to first 20 contributors
+        contributors = data.get("data", [])[:20]
+        
+        return [
+            {
+                "id": item["data"]["id"],
+                "name": item["data"]["username"],
+                "url": f"https://crowdin.com/profile/{item['data']['username']}",
+                "avatar": item["data"]["avatarUrl"]
+            }
+            for item in contributors
+        ]
     except Exception as e:
         logger.error(f"Error fetching Crowdin contributors: {e}")
-        return []
\ No newline at end of file
+        return None
+
+
+@router.get("/github", response_model=List[Contributor])
+async def get_github_contributors():
+    """
+    Get GitHub contributors.
+    """
+    content = await _get_cached("github", _fetch_github_contributors)
+    return Response(content=content, media_type="application/json")
+
+
+@router.get("/crowdin", response_model=List[Contributor])
+async def get_crowdin_contributors():
+    """
+    Get Crowdin contributors.
+    """
+    content = await _get_cached("crowdin", _fetch_crowdin_contributors)
+    return Response(content=content, media_type="application/json")
\ No newline at end of file
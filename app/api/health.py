@@ -1,11 +1,12 @@
+import asyncio
+from functools import lru_cache
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import text
 from sqlalchemy.orm import Session
+import httpx
 import logging
-import boto3
-from botocore.exceptions import ClientError
-import subprocess
-import sys
+import time
 
 from app.database.db import get_db
 from app.config.settings import settings
@@ -14,35 +15,86 @@ from app.config.settings import settings
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Shared dependency markers, reused by every route below
+_DB_DEP = Depends(get_db)
+
+# Statement used to ping the database
+_HEALTH_PING = text("SELECT 1")
+
+# How long a successful storage check is trusted before S3 is probed again
+STORAGE_CHECK_TTL = 30  # seconds
+_storage_healthy_at = 0.0
+
+# Settings that are masked by the /environment endpoint
+SENSITIVE_SETTINGS = frozenset({
+    "ACCESS_TOKEN_SECRET",
+    "REFRESH_TOKEN_SECRET",
+    "STORAGE_ACCESS_KEY",
+    "STORAGE_SECRET_KEY",
+    "GITHUB_CLIENT_SECRET",
+    "GOOGLE_CLIENT_SECRET",
+    "OPENID_CLIENT_SECRET",
+    "CROWDIN_PERSONAL_TOKEN",
+})
+
+# Shared client so browser probes reuse pooled connections
+_http = httpx.AsyncClient(timeout=5)
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP client on application shutdown.
+    """
+    await _http.aclose()
+
 
 async def check_database(db: Session) -> Dict[str, Any]:
     """
     Check database connection.
     """
     try:
-        db.execute("SELECT 1")
+        # Session.execute blocks; run it in a thread so the other probes overlap with it
+        await asyncio.to_thread(db.execute, _HEALTH_PING)
         return {"status": "healthy"}
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
         return {"status": "unhealthy", "message": str(e)}
 
 
+@lru_cache(maxsize=1)
+def _s3_client():
+    """
+    Get the S3/Minio client, built once per process.
+    """
+    # boto3 is slow to import, so only load it once storage is actually checked
+    import boto3
+    
+    return boto3.client(
+        's3',
+        endpoint_url=f"{'https' if settings.STORAGE_USE_SSL else 'http'}://{settings.STORAGE_ENDPOINT}:{settings.STORAGE_PORT}",
+        aws_access_key_id=settings.STORAGE_ACCESS_KEY,
+        aws_secret_access_key=settings.STORAGE_SECRET_KEY,
+        region_name=settings.STORAGE_REGION,
+    )
+
+
 async def check_storage() -> Dict[str, Any]:
     """
     Check storage connection.
     """
+    from botocore.exceptions import ClientError
+    
+    global _storage_healthy_at
+    
+    # Skip the round-trip if the bucket was reachable recently
+    if time.monotonic() - _storage_healthy_at < STORAGE_CHECK_TTL:
+        return {"status": "healthy"}
+    
     try:
-        # Configure S3/Minio client
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=f"{'https' if settings.STORAGE_USE_SSL else 'http'}://{settings.STORAGE_ENDPOINT}:{settings.STORAGE_PORT}",
-            aws_access_key_id=settings.STORAGE_ACCESS_KEY,
-            aws_secret_access_key=settings.STORAGE_SECRET_KEY,
-            region_name=settings.STORAGE_REGION,
-        )
-        
         # Check if bucket exists
-        s3_client.head_bucket(Bucket=settings.STORAGE_BUCKET)
+        # boto3 is blocking; keep the event loop free while S3 answers
+        await asyncio.to_thread(_s3_client().head_bucket, Bucket=settings.STORAGE_BUCKET)
+        _storage_healthy_at = time.monotonic()
         
         return {"status": "healthy"}
     except ClientError as e:
@@ -56,11 +108,7 @@ async def check_browser() -> Dict[str, Any]:
     """
     try:
         # Try to connect to the browser
-        import requests # type: ignore
-        response = requests.get(
-            f"{settings.CHROME_URL}/json/version", 
-            timeout=5
-        )
+        response = await _http.get(f"{settings.CHROME_URL}/json/version")
         
         if response.status_code == 200:
             data = response.json()
@@ -79,13 +127,22 @@ async def check_browser() -> Dict[str, Any]:
 
 
 @router.get("")
-async def health_check(db: Session = Depends(get_db)):
+async def health_check(db: Session = _DB_DEP):
     """
     Perform health check on all services.
     """
-    database_health = await check_database(db)
-    storage_health = await check_storage()
-    browser_health = await check_browser()
+    results = await asyncio.gather(
+        check_database(db),
+        check_storage(),
+        check_browser(),
+        return_exceptions=True
+    )
+    
+    # A probe that raised is reported as unhealthy instead of failing the endpoint
+    database_health, storage_health, browser_health = [
+        {"status": "unhealthy", "message": str(result)} if isinstance(result, Exception) else result
+        for result in results
+    ]
     
     is_healthy = (
         database_health["status"] == "healthy" and
@@ -111,21 +168,8 @@ async def environment():
     if settings.NODE_ENV == "production":
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     
-    # Return all settings, excluding sensitive ones
-    settings_dict = settings.dict()
-    
-    # Hide sensitive values
-    for key in [
-        "ACCESS_TOKEN_SECRET", 
-        "REFRESH_TOKEN_SECRET", 
-        "STORAGE_ACCESS_KEY", 
-        "STORAGE_SECRET_KEY",
-        "GITHUB_CLIENT_SECRET",
-        "GOOGLE_CLIENT_SECRET",
-        "OPENID_CLIENT_SECRET",
-        "CROWDIN_PERSONAL_TOKEN"
-    ]:
-        if key in settings_dict and settings_dict[key]:
-            settings_dict[key] = "******"
-    
-    return settings_dict
\ No newline at end of file
+    # Return all settings, hiding sensitive values
+    return {
+        key: "******" if key in SENSITIVE_SETTINGS and value else value
+        for key, value in settings.model_dump().items()
+    }
\ No newline at end of file
@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Response, status
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Path, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+import json
 import logging
 import uuid
 from typing import Any, Dict, List
@@ -11,6 +13,8 @@ from app.schemas.resume import (
     CreateResumeRequest,
     ImportResumeRequest,
     Resume as ResumeSchema,
+    ResumeData,
+    ResumeSummary,
     UpdateResumeRequest,
     StatisticsResponse,
     PrintResponse
@@ -21,6 +25,7 @@ from app.services.resume import (
     get_all_resumes,
     get_resume_by_id,
     get_resume_by_username_slug,
+    get_resume_for_print,
     get_resume_statistics,
     import_resume,
     lock_resume,
@@ -34,6 +39,14 @@ from app.utils.constants import ErrorMessage
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Shared dependency markers, reused by every route below
+_DB_DEP = Depends(get_db)
+_USER_DEP = Depends(validate_two_factor_auth)
+_OPTIONAL_USER_DEP = Depends(get_current_user_optional)
+
+# The resume schema is fixed for the lifetime of the process, so serialize it once
+_RESUME_SCHEMA_JSON = json.dumps(ResumeData.model_json_schema())
+
 
 # Resume schema endpoint
 @router.get("/schema")
@@ -41,15 +54,14 @@ async def get_schema():
     """
     Get the JSON schema for resume data structure.
     """
-    from app.schemas.resume import ResumeData
-    return ResumeData.model_json_schema()
+    return Response(content=_RESUME_SCHEMA_JSON, media_type="application/json")
 
 # Create a new resume
 @router.post("", response_model=ResumeSchema, status_code=status.HTTP_201_CREATED)
-async def create_new_resume(
+def create_new_resume(
     create_data: CreateResumeRequest,
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Create a new resume.
@@ -67,10 +79,10 @@ async def create_new_resume(
 
 # Import a resume
 @router.post("/import", response_model=ResumeSchema, status_code=status.HTTP_201_CREATED)
-async def import_new_resume(
+def import_new_resume(
     import_data: ImportResumeRequest,
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Import a resume.
@@ -87,24 +99,23 @@ async def import_new_resume(
 
 
 # Get all resumes for current user
-@router.get("", response_model=List[ResumeSchema])
-async def get_user_resumes(
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+@router.get("", response_model=List[ResumeSummary])
+def get_user_resumes(
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Get all resumes for the current user.
     """
-    resumes = get_all_resumes(db, user.id)
-    return [resume for resume in resumes]
+    return get_all_resumes(db, user.id)
 
 
 # Get a specific resume by ID
 @router.get("/{resume_id}", response_model=ResumeSchema)
-async def get_resume(
+def get_resume(
     resume_id: uuid.UUID = Path(...),
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Get a specific resume by ID.
@@ -116,10 +127,10 @@ async def get_resume(
 
 # Get resume statistics
 @router.get("/{resume_id}/statistics", response_model=StatisticsResponse)
-async def get_resume_stats(
+def get_resume_stats(
     resume_id: uuid.UUID = Path(...),
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Get statistics for a specific resume.
@@ -132,11 +143,11 @@ async def get_resume_stats(
 
 # Get a public resume by username and slug
 @router.get("/public/{username}/{slug}", response_model=ResumeSchema)
-async def get_public_resume(
+def get_public_resume(
     username: str = Path(...),
     slug: str = Path(...),
-    user: User = Depends(get_current_user_optional),
-    db: Session = Depends(get_db)
+    user: User = _OPTIONAL_USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Get a public resume by username and slug.
@@ -148,11 +159,11 @@ async def get_public_resume(
 
 # Update a resume
 @router.patch("/{resume_id}", response_model=ResumeSchema)
-async def update_user_resume(
+def update_user_resume(
     update_data: UpdateResumeRequest,
     resume_id: uuid.UUID = Path(...),
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Update a specific resume.
@@ -172,11 +183,11 @@ async def update_user_resume(
 
 # Lock a resume
 @router.patch("/{resume_id}/lock", response_model=ResumeSchema)
-async def lock_user_resume(
+def lock_user_resume(
     resume_id: uuid.UUID = Path(...),
     set: bool = Body(True, embed=True),
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Lock or unlock a resume.
@@ -194,10 +205,10 @@ async def lock_user_resume(
 
 # Delete a resume
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user_resume(
+def delete_user_resume(
     resume_id: uuid.UUID = Path(...),
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Delete a resume.
@@ -217,43 +228,21 @@ async def delete_user_resume(
 # Print a resume (generate PDF)
 @router.get("/print/{resume_id}", response_model=PrintResponse)
 async def print_resume_endpoint(
+    background_tasks: BackgroundTasks,
     resume_id: uuid.UUID = Path(...),
-    user: User = Depends(get_current_user_optional),
-    db: Session = Depends(get_db)
+    user: User = _OPTIONAL_USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Generate a PDF for a resume.
     """
     try:
-        # Get the resume - this will also handle access control
-        if user:
-            # Try to get as the authenticated user
-            try:
-                resume = get_resume_by_id(db, resume_id, user.id)
-            except HTTPException:
-                # If the user doesn't own this resume, try to get it as a public resume
-                resume = get_resume_by_id(db, resume_id)
-                
-                # If it's not public, raise an exception
-                if resume.visibility != "public":
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=ErrorMessage.RESUME_NOT_FOUND
-                    )
-        else:
-            # Get as public resume
-            resume = get_resume_by_id(db, resume_id)
-            
-            # If it's not public, raise an exception
-            if resume.visibility != "public":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=ErrorMessage.RESUME_NOT_FOUND
-                )
+        # Get the resume - owners can print private resumes, everyone else only public ones
+        user_id = user.id if user else None
+        resume = await run_in_threadpool(get_resume_for_print, db, resume_id, user_id)
         
         # Generate PDF
-        user_id = user.id if user else None
-        url = await print_resume(db, resume, user_id)
+        url = await print_resume(db, resume, user_id, background_tasks)
         
         return {"url": url}
     except HTTPException:
@@ -270,15 +259,15 @@ async def print_resume_endpoint(
 @router.get("/print/{resume_id}/preview", response_model=PrintResponse)
 async def print_resume_preview(
     resume_id: uuid.UUID = Path(...),
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Generate a preview image for a resume.
     """
     try:
         # Get the resume - this will handle access control
-        resume = get_resume_by_id(db, resume_id, user.id)
+        resume = await run_in_threadpool(get_resume_by_id, db, resume_id, user.id)
         
         # Generate preview
         url = await print_preview(resume)
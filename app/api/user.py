@@ -1,58 +1,76 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
+import hashlib
 import logging
 
 from app.database.db import get_db
-from app.middlewares.auth import validate_two_factor_auth
+from app.middlewares.auth import authenticate_request, validate_two_factor_auth
 from app.models.models import User
 from app.schemas.auth import MessageResponse
 from app.schemas.user import User as UserSchema, UpdateUserRequest
 from app.services.auth import send_verification_email, set_refresh_token
-from app.services.user import delete_user, update_user, update_user_email
+from app.services.user import cache_me, delete_user, get_cached_me, update_user
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Shared dependency markers, reused by every route below
+_DB_DEP = Depends(get_db)
+_USER_DEP = Depends(validate_two_factor_auth)
 
-@router.get("/me")
-async def get_current_user(
-    user: User = Depends(validate_two_factor_auth)
+
+@router.get("/me", response_model=UserSchema)
+def get_current_user(
+    request: Request,
+    db: Session = _DB_DEP
 ):
     """
     Get the current user.
+    Responses are cached briefly per access token, so SPA session polling
+    skips token validation, the user lookup and serialization.
     """
-    return user
+    token = request.cookies.get("Authentication")
+    token_digest = hashlib.sha256(token.encode()).digest() if token else None
+    
+    if token_digest:
+        body = get_cached_me(token_digest)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
+    
+    user = authenticate_request(request, db)
+    body = UserSchema.model_validate(user).model_dump_json().encode()
+    
+    if token_digest:
+        cache_me(token_digest, user.id, body)
+    
+    return Response(content=body, media_type="application/json")
 
 
 @router.patch("/me", response_model=UserSchema)
-async def update_current_user(
+def update_current_user(
     update_data: UpdateUserRequest,
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Update the current user.
     """
+    # Nothing to change (empty body or values equal to the current ones): skip the write
+    changes = {field: value for field, value in update_data.model_dump(exclude_unset=True).items() if value}
+    if all(getattr(user, field) == value for field, value in changes.items()):
+        return user
+    
     try:
+        # Checked up front: `user` is the same session object update_user modifies
+        email_changed = bool(update_data.email) and update_data.email != user.email
+        
+        updated_user = update_user(db, user.id, update_data)
+        
         # If user is updating their email, send a verification email
-        if update_data.email and update_data.email != user.email:
-            # Update email
-            update_user_email(db, user.id, update_data.email)
-            
-            # Send verification email
-            send_verification_email(db, update_data.email)
-            
-            # Update other fields if necessary
-            update_data_without_email = UpdateUserRequest(
-                name=update_data.name,
-                username=update_data.username,
-                picture=update_data.picture
-            )
-            
-            updated_user = update_user(db, user.id, update_data_without_email)
-        else:
-            # Update user without changing email
-            updated_user = update_user(db, user.id, update_data)
+        if email_changed:
+            send_verification_email(db, update_data.email, background_tasks)
         
         return updated_user
     except Exception as e:
@@ -64,10 +82,9 @@ async def update_current_user(
 
 
 @router.delete("/me", response_model=MessageResponse)
-async def delete_current_user(
-    response: Response,
-    user: User = Depends(validate_two_factor_auth),
-    db: Session = Depends(get_db)
+def delete_current_user(
+    user: User = _USER_DEP,
+    db: Session = _DB_DEP
 ):
     """
     Delete the current user.
@@ -76,11 +93,12 @@ async def delete_current_user(
         # Delete the user
         delete_user(db, user.id)
         
-        # Clear cookies
+        # Build the response directly and clear cookies on it
+        response = ORJSONResponse({"message": "Sorry to see you go, goodbye!"})
         response.delete_cookie("Authentication")
         response.delete_cookie("Refresh")
         
-        return {"message": "Sorry to see you go, goodbye!"}
+        return response
     except Exception as e:
         logger.error(f"Error deleting user: {e}")
         raise HTTPException(
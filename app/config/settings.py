@@ -1,8 +1,9 @@
+from functools import cached_property, lru_cache
 from typing import Any, Dict, List, Optional, Union
 from pydantic import PostgresDsn, AnyHttpUrl,AnyUrl
 from pydantic_settings import BaseSettings
 import os
-class settings(BaseSettings):
+class Settings(BaseSettings):
     # Environment
     NODE_ENV: str = "production"
     
@@ -15,6 +16,16 @@ class settings(BaseSettings):
     
     DATABASE_URL: PostgresDsn
     
+    # Database connection pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 30
+    # PDF rendering worker processes per server process
+    PDF_WORKERS: int = 2
+    # Create missing tables on startup (always on in development and test)
+    INIT_DB: bool = False
+    
     # Authentication Secrets
     ACCESS_TOKEN_SECRET: str
     REFRESH_TOKEN_SECRET: str
@@ -45,9 +56,24 @@ class settings(BaseSettings):
     GOOGLE_CALLBACK_URL: Optional[AnyHttpUrl] = None
     
     
+    @cached_property
+    def public_url(self) -> str:
+        """
+        PUBLIC_URL as a plain string without the trailing slash Pydantic adds.
+        """
+        return str(self.PUBLIC_URL).rstrip("/")
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
-settings = settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load settings once per process; .env is parsed and validated on first call only.
+    """
+    return Settings()
+
+
+settings = get_settings()
\ No newline at end of file
@@ -1,28 +1,38 @@
+from dataclasses import dataclass
 from typing import Optional, Union
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from fastapi.security.utils import get_authorization_scheme_param
 from sqlalchemy.orm import Session
-import jwt
 
 from app.database.db import get_db
 from app.models.models import User
 from app.schemas.auth import TokenPayload
 from app.utils.constants import ErrorMessage
-from app.utils.security import decode_token
+from app.utils.security import decode_token_cached
 from app.services.user import get_user_by_id
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login", auto_error=False)
 
 
-def get_current_user_optional(
+@dataclass
+class AuthenticatedUser:
+    """
+    User resolved from the access token cookie.
+    """
+    user: User
+    is_two_factor_auth: bool = False
+
+
+def _resolve_user(
     request: Request,
     db: Session = Depends(get_db),
-) -> Optional[User]:
+) -> Optional[AuthenticatedUser]:
     """
-    Get current user if authenticated, otherwise return None.
-    This is for endpoints that work both with and without authentication.
+    Decode the access token cookie and load its user, or return None.
+    All auth dependencies depend on this one so FastAPI's per-request
+    dependency cache runs the decode and the user lookup at most once.
     """
     token = request.cookies.get("Authentication")
     
@@ -30,36 +40,48 @@ def get_current_user_optional(
         return None
     
     try:
-        payload = decode_token(token, "access")
-        user_id = payload.get("sub")
-        if not user_id:
-            return None
-        
-        user = get_user_by_id(db, user_id)
-        if not user:
-            return None
-            
-        return user
-    except jwt.PyJWTError:
+        payload = decode_token_cached(token, "access")
+    except HTTPException:
+        return None
+    
+    user_id = payload.get("sub")
+    if not user_id:
         return None
+    
+    user = get_user_by_id(db, user_id)
+    if not user:
+        return None
+    
+    return AuthenticatedUser(
+        user=user,
+        is_two_factor_auth=payload.get("is_two_factor_auth", False)
+    )
+
+
+def get_current_user_optional(
+    auth: Optional[AuthenticatedUser] = Depends(_resolve_user),
+) -> Optional[User]:
+    """
+    Get current user if authenticated, otherwise return None.
+    This is for endpoints that work both with and without authentication.
+    """
+    return auth.user if auth else None
 
 
 def get_current_user(
-    request: Request,
-    db: Session = Depends(get_db),
+    auth: Optional[AuthenticatedUser] = Depends(_resolve_user),
 ) -> User:
     """
     Get current user if authenticated, otherwise raise an exception.
     This is for endpoints that require authentication.
     """
-    user = get_current_user_optional(request, db)
-    if user is None:
+    if auth is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return user
+    return auth.user
 
 
 def get_current_active_user(
@@ -76,53 +98,33 @@ def get_current_active_user(
     return current_user
 
 
+def authenticate_request(request: Request, db: Session) -> User:
+    """
+    Resolve and validate the current user outside dependency injection,
+    for handlers that check a cache before touching the database.
+    """
+    return validate_two_factor_auth(request, _resolve_user(request, db))
+
+
 def validate_two_factor_auth(
     request: Request,
-    db: Session = Depends(get_db),
+    auth: Optional[AuthenticatedUser] = Depends(_resolve_user),
 ) -> User:
     """
     Validate two-factor authentication.
     """
-    token = request.cookies.get("Authentication")
-    
-    if not token:
+    if auth is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
+            detail="Invalid token" if request.cookies.get("Authentication") else "Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    try:
-        payload = decode_token(token, "access")
-        user_id = payload.get("sub")
-        is_two_factor_auth = payload.get("is_two_factor_auth", False)
-        
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        user = get_user_by_id(db, user_id)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # If user has 2FA enabled, we need to check if the token has been verified
-        if user.twoFactorEnabled and not is_two_factor_auth:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Two-factor authentication required",
-            )
-            
-        return user
-    except jwt.PyJWTError:
+    # If user has 2FA enabled, we need to check if the token has been verified
+    if auth.user.twoFactorEnabled and not auth.is_two_factor_auth:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Two-factor authentication required",
+        )
+    
+    return auth.user
@@ -0,0 +1,32 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ProcessTimeMiddleware:
+    """
+    Add an X-Process-Time header (seconds) to API responses.
+    Pure ASGI, so it adds no per-request task or body buffering, and
+    anything outside the API prefix (static assets, docs) passes straight through.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api/") -> None:
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        # perf_counter_ns is monotonic, so timings can't go negative across clock adjustments
+        start_ns = time.perf_counter_ns()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", f"{(time.perf_counter_ns() - start_ns) / 1e9:.6f}")
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,11 +1,11 @@
 import uuid
 import enum
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text, JSON
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text, JSON, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.db import Base
 
@@ -25,74 +25,74 @@ class Visibility(str, enum.Enum):
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String, nullable=False)
-    email = Column(String, unique=True, nullable=False, index=True)
-    username = Column(String, unique=True, nullable=False, index=True)
-    picture = Column(String, nullable=True)
-    provider = Column(Enum(Provider), nullable=False, default=Provider.EMAIL)
-    emailVerified = Column(Boolean, nullable=False, default=False)
-    twoFactorEnabled = Column(Boolean, nullable=False, default=False)
-    createdAt = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updatedAt = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    email: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
+    username: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
+    picture: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    provider: Mapped[Provider] = mapped_column(Enum(Provider), nullable=False, default=Provider.EMAIL)
+    emailVerified: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    twoFactorEnabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    createdAt: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updatedAt: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    secrets = relationship("Secrets", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    resumes = relationship("Resume", back_populates="user", cascade="all, delete-orphan")
+    secrets: Mapped[Optional["Secrets"]] = relationship("Secrets", back_populates="user", uselist=False, cascade="all, delete-orphan")
+    resumes: Mapped[List["Resume"]] = relationship("Resume", back_populates="user", cascade="all, delete-orphan")
 
 
 class Secrets(Base):
     __tablename__ = "secrets"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    userId = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
-    password = Column(String, nullable=True)
-    resetToken = Column(String, nullable=True, unique=True, index=True)
-    verificationToken = Column(String, nullable=True)
-    twoFactorSecret = Column(String, nullable=True)
-    twoFactorBackupCodes = Column(JSON, nullable=False, default=list)
-    refreshToken = Column(String, nullable=True)
-    lastSignedIn = Column(DateTime, nullable=True)
-    createdAt = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updatedAt = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    userId: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
+    password: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    resetToken: Mapped[Optional[str]] = mapped_column(String, nullable=True, unique=True, index=True)
+    verificationToken: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    twoFactorSecret: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    twoFactorBackupCodes: Mapped[Any] = mapped_column(JSON, nullable=False, default=list)
+    refreshToken: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    lastSignedIn: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    createdAt: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updatedAt: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    user = relationship("User", back_populates="secrets")
+    user: Mapped["User"] = relationship("User", back_populates="secrets")
 
 
 class Resume(Base):
     __tablename__ = "resumes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    userId = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    title = Column(String, nullable=False)
-    slug = Column(String, nullable=False)
-    visibility = Column(Enum(Visibility), nullable=False, default=Visibility.PRIVATE)
-    locked = Column(Boolean, nullable=False, default=False)
-    data = Column(JSON, nullable=False)
-    createdAt = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updatedAt = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-    # # Composite unique constraint on userId and id
-    # __table_args__ = (
-    #     {"unique": (userId, id)},
-    #     {"unique": (userId, slug)},
-    # )
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    userId: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    slug: Mapped[str] = mapped_column(String, nullable=False)
+    visibility: Mapped[Visibility] = mapped_column(Enum(Visibility), nullable=False, default=Visibility.PRIVATE)
+    locked: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    data: Mapped[Any] = mapped_column(JSON, nullable=False)
+    createdAt: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updatedAt: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Slugs are unique per user; both indexes lead with userId for owner lookups
+    __table_args__ = (
+        UniqueConstraint("userId", "slug", name="uq_resume_user_slug"),
+        Index("ix_resume_user_id", "userId", "id"),
+    )
 
     # Relationships
-    user = relationship("User", back_populates="resumes")
-    statistics = relationship("Statistics", back_populates="resume", uselist=False, cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User", back_populates="resumes")
+    statistics: Mapped[Optional["Statistics"]] = relationship("Statistics", back_populates="resume", uselist=False, cascade="all, delete-orphan")
 
 
 class Statistics(Base):
     __tablename__ = "statistics"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    resumeId = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), unique=True, nullable=False)
-    views = Column(Integer, nullable=False, default=0)
-    downloads = Column(Integer, nullable=False, default=0)
-    createdAt = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updatedAt = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    resumeId: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), unique=True, nullable=False)
+    views: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    downloads: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    createdAt: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updatedAt: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    resume = relationship("Resume", back_populates="statistics")
\ No newline at end of file
+    resume: Mapped["Resume"] = relationship("Resume", back_populates="statistics")
\ No newline at end of file
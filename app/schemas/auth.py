@@ -1,11 +1,15 @@
 from typing import List, Literal, Optional, Union
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from datetime import datetime
 import re
 
 from app.schemas.user import User, UserWithSecrets
 
 
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_PASSWORD_MIN = 8
+
+
 class TokenPayload(BaseModel):
     sub: str
     is_two_factor_auth: bool = False
@@ -16,18 +20,17 @@ class RegisterRequest(BaseModel):
     email: EmailStr
     username: str
     password: str
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
     
     @field_validator('username')
     def username_alphanumeric(cls, v):
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _USERNAME_RE.match(v):
             raise ValueError('Username must be alphanumeric with only underscores and hyphens allowed')
         return v
     
     @field_validator('password')
     def password_min_length(cls, v):
-        if len(v) < 8:
+        if len(v) < _PASSWORD_MIN:
             raise ValueError('Password must be at least 8 characters long')
         return v
 
@@ -43,7 +46,7 @@ class UpdatePasswordRequest(BaseModel):
     
     @field_validator('newPassword')
     def password_min_length(cls, v):
-        if len(v) < 8:
+        if len(v) < _PASSWORD_MIN:
             raise ValueError('Password must be at least 8 characters long')
         return v
 
@@ -55,11 +58,10 @@ class ForgotPasswordRequest(BaseModel):
 class ResetPasswordRequest(BaseModel):
     token: str
     password: str
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
     @field_validator('password')
     def password_min_length(cls, v):
-        if len(v) < 8:
+        if len(v) < _PASSWORD_MIN:
             raise ValueError('Password must be at least 8 characters long')
         return v
 
@@ -1,10 +1,14 @@
 from typing import Dict, List, Literal, Optional, Union, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
 import uuid
 import re
 
 
+_SLUG_RE = re.compile(r'^[a-z0-9-]+$')
+_SLUGIFY_RE = re.compile(r'[^a-z0-9]+')
+
+
 class CreateResumeRequest(BaseModel):
     title: str
     slug: Optional[str] = None
@@ -15,10 +19,10 @@ class CreateResumeRequest(BaseModel):
         if v is None:
             # Auto-generate slug from title if not provided
             if 'title' in values:
-                return re.sub(r'[^a-z0-9]+', '-', values['title'].lower()).strip('-')
+                return _SLUGIFY_RE.sub('-', values['title'].lower()).strip('-')
         else:
             # Validate slug format if provided
-            if not re.match(r'^[a-z0-9-]+$', v):
+            if not _SLUG_RE.match(v):
                 raise ValueError('Slug must contain only lowercase alphanumeric characters and hyphens')
         return v
 
@@ -75,8 +79,21 @@ class Resume(BaseModel):
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ResumeSummary(BaseModel):
+    """Resume without its data, for list views"""
+    id: uuid.UUID
+    userId: uuid.UUID
+    title: str
+    slug: str
+    visibility: Literal["public", "private"]
+    locked: bool = False
+    createdAt: datetime
+    updatedAt: datetime
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UpdateResumeRequest(BaseModel):
@@ -87,7 +104,7 @@ class UpdateResumeRequest(BaseModel):
     
     @field_validator('slug')
     def validate_slug(cls, v):
-        if v is not None and not re.match(r'^[a-z0-9-]+$', v):
+        if v is not None and not _SLUG_RE.match(v):
             raise ValueError('Slug must contain only lowercase alphanumeric characters and hyphens')
         return v
 
@@ -1,10 +1,13 @@
 from typing import List, Literal, Optional
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from datetime import datetime
 import re
 import uuid
 
 
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+
 class UserSecrets(BaseModel):
     id: uuid.UUID
     userId: uuid.UUID
@@ -18,8 +21,7 @@ class UserSecrets(BaseModel):
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class User(BaseModel):
@@ -34,8 +36,7 @@ class User(BaseModel):
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserSchema(BaseModel):
@@ -50,15 +51,13 @@ class UserSchema(BaseModel):
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserWithSecrets(User):
     secrets: Optional[UserSecrets] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UpdateUserRequest(BaseModel):
@@ -69,6 +68,6 @@ class UpdateUserRequest(BaseModel):
     
     @field_validator('username')
     def username_alphanumeric(cls, v):
-        if v is not None and not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if v is not None and not _USERNAME_RE.match(v):
             raise ValueError('Username must be alphanumeric with only underscores and hyphens allowed')
         return v
\ No newline at end of file
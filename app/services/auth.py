@@ -1,7 +1,9 @@
 from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
 from sqlalchemy.orm import Session
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
+import hmac
 import pyotp
 import logging
 from uuid import UUID
@@ -15,14 +17,17 @@ from app.utils.security import (
     create_access_token, 
     create_refresh_token,
     generate_random_token,
-    generate_random_backup_codes
+    generate_random_backup_codes,
+    hash_token
 )
 from app.services.user import (
-    get_user_by_id,
     get_user_by_email,
     get_user_by_username,
-    get_user_by_identifier,
+    get_user_with_secrets,
+    get_user_with_secrets_by_email,
+    get_user_with_secrets_by_identifier,
     create_user,
+    invalidate_me_cache,
     update_user_secrets
 )
 from app.services.mail import send_email
@@ -32,7 +37,11 @@ from app.config.settings import settings
 logger = logging.getLogger(__name__)
 
 
-def register_user(db: Session, register_data: RegisterRequest) -> User:
+def register_user(
+    db: Session,
+    register_data: RegisterRequest,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> User:
     """
     Register a new user.
     """
@@ -48,7 +57,7 @@ def register_user(db: Session, register_data: RegisterRequest) -> User:
         )
         
         # Send verification email
-        send_verification_email(db, user.email)
+        send_verification_email(db, user.email, background_tasks)
         
         return user
     except Exception as e:
@@ -63,7 +72,7 @@ def authenticate_user(db: Session, login_data: LoginRequest) -> User:
     """
     Authenticate user with email/username and password.
     """
-    user = get_user_by_identifier(db, login_data.identifier)
+    user, secrets = get_user_with_secrets_by_identifier(db, login_data.identifier)
     
     if not user:
         raise HTTPException(
@@ -71,9 +80,6 @@ def authenticate_user(db: Session, login_data: LoginRequest) -> User:
             detail=ErrorMessage.INVALID_CREDENTIALS
         )
     
-    # Get user secrets
-    secrets = db.query(Secrets).filter(Secrets.userId == user.id).first()
-    
     if not secrets or not secrets.password:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -86,10 +92,7 @@ def authenticate_user(db: Session, login_data: LoginRequest) -> User:
             detail=ErrorMessage.INVALID_CREDENTIALS
         )
     
-    # Update last sign in time
-    secrets.lastSignedIn = datetime.utcnow()
-    db.commit()
-    
+    # Last sign in time is recorded together with the new refresh token
     return user
 
 
@@ -106,17 +109,11 @@ def create_auth_tokens(user_id: Union[str, UUID], is_two_factor_auth: bool = Fal
     }
 
 
-def set_refresh_token(db: Session, email: str, token: Optional[str]) -> None:
+def set_refresh_token(db: Session, user_id: Union[str, UUID], token: Optional[str]) -> None:
     """
     Set refresh token for a user.
+    Issues a single UPDATE on the user's secrets instead of loading them first.
     """
-    user = get_user_by_email(db, email)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=ErrorMessage.USER_NOT_FOUND
-        )
-    
     update_data = {
         "refreshToken": token
     }
@@ -124,24 +121,22 @@ def set_refresh_token(db: Session, email: str, token: Optional[str]) -> None:
     if token:
         update_data["lastSignedIn"] = datetime.utcnow()
     
-    update_user_secrets(db, user.id, update_data)
+    db.query(Secrets).filter(Secrets.userId == user_id).update(update_data, synchronize_session=False)
+    db.commit()
 
 
 def validate_refresh_token(db: Session, user_id: Union[str, UUID], token: str) -> User:
     """
     Validate refresh token.
     """
-    user = get_user_by_id(db, user_id)
+    user, secrets = get_user_with_secrets(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid refresh token"
         )
     
-    # Get user secrets
-    secrets = db.query(Secrets).filter(Secrets.userId == user.id).first()
-    
-    if not secrets or not secrets.refreshToken or secrets.refreshToken != token:
+    if not secrets or not secrets.refreshToken or not hmac.compare_digest(secrets.refreshToken, token):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid refresh token"
@@ -154,16 +149,13 @@ def update_password(db: Session, email: str, current_password: str, new_password
     """
     Update user password.
     """
-    user = get_user_by_email(db, email)
+    user, secrets = get_user_with_secrets_by_email(db, email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ErrorMessage.USER_NOT_FOUND
         )
     
-    # Get user secrets
-    secrets = db.query(Secrets).filter(Secrets.userId == user.id).first()
-    
     if not secrets or not secrets.password:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -180,9 +172,14 @@ def update_password(db: Session, email: str, current_password: str, new_password
     update_user_secrets(db, user.id, {"password": new_password})
 
 
-def forgot_password(db: Session, email: str) -> None:
+def forgot_password(
+    db: Session,
+    email: str,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> None:
     """
     Generate and send password reset token.
+    With background_tasks the SMTP send runs after the response.
     """
     user = get_user_by_email(db, email)
     if not user:
@@ -196,13 +193,16 @@ def forgot_password(db: Session, email: str) -> None:
     update_user_secrets(db, user.id, {"resetToken": reset_token})
     
     # Send reset email
-    base_url = settings.PUBLIC_URL
+    base_url = settings.public_url
     reset_url = f"{base_url}/auth/reset-password?token={reset_token}"
     
     subject = "Reset your Reactive Resume password"
     text = f"Please click on the link below to reset your password:\n\n{reset_url}"
     
-    send_email(to=email, subject=subject, text=text)
+    if background_tasks is not None:
+        background_tasks.add_task(send_email, to=email, subject=subject, text=text)
+    else:
+        send_email(to=email, subject=subject, text=text)
 
 
 def reset_password(db: Session, token: str, password: str) -> None:
@@ -229,9 +229,14 @@ def reset_password(db: Session, token: str, password: str) -> None:
     )
 
 
-def send_verification_email(db: Session, email: str) -> None:
+def send_verification_email(
+    db: Session,
+    email: str,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> None:
     """
     Send email verification.
+    The token is saved immediately; with background_tasks the SMTP send runs after the response.
     """
     user = get_user_by_email(db, email)
     if not user:
@@ -247,40 +252,41 @@ def send_verification_email(db: Session, email: str) -> None:
     update_user_secrets(db, user.id, {"verificationToken": verification_token})
     
     # Send verification email
-    base_url = settings.PUBLIC_URL
+    base_url = settings.public_url
     verify_url = f"{base_url}/auth/verify-email?token={verification_token}"
     
     subject = "Verify your email address"
     text = f"Please verify your email address by clicking on the link below:\n\n{verify_url}"
     
-    send_email(to=email, subject=subject, text=text)
+    if background_tasks is not None:
+        background_tasks.add_task(send_email, to=email, subject=subject, text=text)
+    else:
+        send_email(to=email, subject=subject, text=text)
 
 
 def verify_email(db: Session, user_id: Union[str, UUID], token: str) -> None:
     """
     Verify email using verification token.
     """
-    user = get_user_by_id(db, user_id)
+    user, secrets = get_user_with_secrets(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ErrorMessage.USER_NOT_FOUND
         )
     
-    # Get user secrets
-    secrets = db.query(Secrets).filter(Secrets.userId == user.id).first()
-    
     if not secrets or not secrets.verificationToken : #or secrets.verificationToken != token
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=ErrorMessage.INVALID_VERIFICATION_TOKEN
         )
     
-    # Update user and clear verification token
+    # Update user and clear verification token in one commit
     user.emailVerified = True
-    update_user_secrets(db, user.id, {"verificationToken": None})
+    secrets.verificationToken = None
     
     db.commit()
+    invalidate_me_cache(user.id)
 
 
 def setup_two_factor(db: Session, email: str) -> str:
@@ -317,7 +323,7 @@ def enable_two_factor(db: Session, email: str, code: str) -> List[str]:
     """
     Enable two-factor authentication and generate backup codes.
     """
-    user = get_user_by_email(db, email)
+    user, secrets = get_user_with_secrets_by_email(db, email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -330,9 +336,6 @@ def enable_two_factor(db: Session, email: str, code: str) -> List[str]:
             detail=ErrorMessage.TWO_FACTOR_ALREADY_ENABLED
         )
     
-    # Get user secrets
-    secrets = db.query(Secrets).filter(Secrets.userId == user.id).first()
-    
     if not secrets or not secrets.twoFactorSecret:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -350,11 +353,12 @@ def enable_two_factor(db: Session, email: str, code: str) -> List[str]:
     # Generate backup codes
     backup_codes = generate_random_backup_codes(8)
     
-    # Enable 2FA and save backup codes
+    # Enable 2FA and save backup codes in one commit (only their hashes are stored; the codes are shown once)
     user.twoFactorEnabled = True
-    update_user_secrets(db, user.id, {"twoFactorBackupCodes": backup_codes})
+    secrets.twoFactorBackupCodes = [hash_token(c) for c in backup_codes]
     
     db.commit()
+    invalidate_me_cache(user.id)
     
     return backup_codes
 
@@ -376,25 +380,22 @@ def disable_two_factor(db: Session, email: str) -> None:
             detail=ErrorMessage.TWO_FACTOR_NOT_ENABLED
         )
     
-    # Disable 2FA and clear secrets
+    # Disable 2FA and clear secrets in one commit
     user.twoFactorEnabled = False
-    update_user_secrets(
-        db, 
-        user.id, 
-        {
-            "twoFactorSecret": None,
-            "twoFactorBackupCodes": []
-        }
+    db.query(Secrets).filter(Secrets.userId == user.id).update(
+        {"twoFactorSecret": None, "twoFactorBackupCodes": []},
+        synchronize_session=False
     )
     
     db.commit()
+    invalidate_me_cache(user.id)
 
 
 def verify_two_factor_code(db: Session, email: str, code: str) -> User:
     """
     Verify two-factor authentication code.
     """
-    user = get_user_by_email(db, email)
+    user, secrets = get_user_with_secrets_by_email(db, email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -407,9 +408,6 @@ def verify_two_factor_code(db: Session, email: str, code: str) -> User:
             detail=ErrorMessage.TWO_FACTOR_NOT_ENABLED
         )
     
-    # Get user secrets
-    secrets = db.query(Secrets).filter(Secrets.userId == user.id).first()
-    
     if not secrets or not secrets.twoFactorSecret:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -431,7 +429,7 @@ def use_two_factor_backup_code(db: Session, email: str, code: str) -> User:
     """
     Use two-factor authentication backup code.
     """
-    user = get_user_by_email(db, email)
+    user, secrets = get_user_with_secrets_by_email(db, email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -444,30 +442,36 @@ def use_two_factor_backup_code(db: Session, email: str, code: str) -> User:
             detail=ErrorMessage.TWO_FACTOR_NOT_ENABLED
         )
     
-    # Get user secrets
-    secrets = db.query(Secrets).filter(Secrets.userId == user.id).first()
-    
     if not secrets or not secrets.twoFactorSecret:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=ErrorMessage.TWO_FACTOR_NOT_ENABLED
         )
     
-    # Check if backup code is valid
-    if not secrets.twoFactorBackupCodes or code not in secrets.twoFactorBackupCodes:
+    # Check if backup code is valid; codes saved before hashing was introduced are plaintext
+    stored_codes = set(secrets.twoFactorBackupCodes or ())
+    code_hash = hash_token(code)
+    matched = code_hash if code_hash in stored_codes else code if code in stored_codes else None
+    
+    if matched is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=ErrorMessage.INVALID_TWO_FACTOR_BACKUP_CODE
         )
     
     # Remove used backup code
-    backup_codes = [c for c in secrets.twoFactorBackupCodes if c != code]
-    update_user_secrets(db, user.id, {"twoFactorBackupCodes": backup_codes})
+    stored_codes.discard(matched)
+    update_user_secrets(db, user.id, {"twoFactorBackupCodes": list(stored_codes)})
     
     return user
 
 
+@lru_cache(maxsize=1)
 def get_auth_providers() -> List[str]:
+    """
+    Get enabled authentication providers.
+    Settings are fixed for the process, so this is computed once; treat the list as read-only.
+    """
     providers = []
     
     if not settings.DISABLE_EMAIL_AUTH:
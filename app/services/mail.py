@@ -1,5 +1,7 @@
 import logging
 import smtplib
+import threading
+from dataclasses import dataclass
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Dict, List, Optional, Union
@@ -10,6 +12,103 @@ from app.config.settings import settings
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SmtpConfig:
+    """
+    Connection details parsed from SMTP_URL.
+    """
+    host: str
+    port: int
+    is_ssl: bool
+    username: Optional[str] = None
+    password: Optional[str] = None
+
+
+def _parse_smtp_url(smtp_url) -> Optional[SmtpConfig]:
+    """
+    Parse SMTP_URL into an SmtpConfig, or None if SMTP is not configured.
+    """
+    if not smtp_url:
+        return None
+    
+    parsed_url = urlparse(str(smtp_url))
+    
+    # Determine if we're using SSL
+    is_ssl = parsed_url.scheme == "smtps"
+    
+    return SmtpConfig(
+        host=parsed_url.hostname or "localhost",
+        port=parsed_url.port or (465 if is_ssl else 25),
+        is_ssl=is_ssl,
+        username=parsed_url.username,
+        password=parsed_url.password
+    )
+
+
+# SMTP settings never change at runtime, so parse them once
+_SMTP_CONFIG = _parse_smtp_url(settings.SMTP_URL)
+_MAIL_FROM = settings.MAIL_FROM
+
+# Seconds to wait on any SMTP socket operation; the shared connection is used under a
+# global lock, so a hung server must not be able to stall every later send
+SMTP_TIMEOUT = 10
+
+# One authenticated SMTP connection per process, reused across sends
+_smtp: Optional[smtplib.SMTP] = None
+_smtp_lock = threading.Lock()
+
+# Errors where the server answered and refused the message. smtplib has already sent RSET,
+# so the connection is still usable; SMTPRecipientsRefused is not an SMTPResponseException.
+_SMTP_REFUSED = (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused)
+
+
+def _get_smtp(config: SmtpConfig) -> smtplib.SMTP:
+    """
+    Return the shared SMTP connection, connecting and logging in on first use.
+    Must be called with _smtp_lock held.
+    """
+    global _smtp
+    
+    if _smtp is not None:
+        return _smtp
+    
+    # Create SMTP connection based on SSL or not
+    if config.is_ssl:
+        server = smtplib.SMTP_SSL(config.host, config.port, timeout=SMTP_TIMEOUT)
+    else:
+        server = smtplib.SMTP(config.host, config.port, timeout=SMTP_TIMEOUT)
+        server.ehlo()
+        if server.has_extn('STARTTLS'):
+            server.starttls()
+            server.ehlo()
+    
+    # Login if credentials are provided
+    if config.username and config.password:
+        server.login(config.username, config.password)
+    
+    _smtp = server
+    return _smtp
+
+
+def _reset_smtp(graceful: bool = True) -> None:
+    """
+    Drop the shared SMTP connection so the next send reconnects.
+    With graceful=False the socket is closed without sending QUIT (for unresponsive servers).
+    Must be called with _smtp_lock held.
+    """
+    global _smtp
+    
+    if _smtp is not None:
+        try:
+            if graceful:
+                _smtp.quit()
+            else:
+                _smtp.close()
+        except (smtplib.SMTPException, OSError):
+            pass
+    _smtp = None
+
+
 def send_email(
     to: Union[str, List[str]],
     subject: str,
@@ -25,28 +124,14 @@ def send_email(
     If SMTP_URL is not set, logs the email to console instead.
     """
     # If SMTP_URL is not set, log the email to console
-    if not settings.SMTP_URL:
+    if _SMTP_CONFIG is None:
         logger.info(f"SMTP not configured. Would have sent email: To={to}, Subject={subject}, Body={text[:100]}...")
         return
     
-    # Parse SMTP URL
-    parsed_url = urlparse(str(settings.SMTP_URL))
-    
-    # Determine if we're using SSL
-    is_ssl = parsed_url.scheme == "smtps"
-    
-    # Get host and port
-    host = parsed_url.hostname or "localhost"
-    port = parsed_url.port or (465 if is_ssl else 25)
-    
-    # Get username and password if provided
-    username = parsed_url.username
-    password = parsed_url.password
-    
     # Create message
     msg = MIMEMultipart('alternative')
     msg['Subject'] = subject
-    msg['From'] = settings.MAIL_FROM
+    msg['From'] = _MAIL_FROM
     
     # Handle recipients
     if isinstance(to, list):
@@ -68,30 +153,36 @@ def send_email(
         msg.attach(MIMEText(html, 'html'))
     
     # Determine all recipients
-    recipients = [to] if isinstance(to, str) else to
+    recipients = [to] if isinstance(to, str) else list(to)
     if cc:
         recipients.extend(cc)
     if bcc:
         recipients.extend(bcc)
     
     try:
-        # Create SMTP connection based on SSL or not
-        if is_ssl:
-            server = smtplib.SMTP_SSL(host, port)
-        else:
-            server = smtplib.SMTP(host, port)
-            server.ehlo()
-            if server.has_extn('STARTTLS'):
-                server.starttls()
-                server.ehlo()
-        
-        # Login if credentials are provided
-        if username and password:
-            server.login(username, password)
-        
-        # Send the email
-        server.sendmail(settings.MAIL_FROM, recipients, msg.as_string())
-        server.quit()
+        with _smtp_lock:
+            try:
+                server = _get_smtp(_SMTP_CONFIG)
+                server.send_message(msg, from_addr=_MAIL_FROM, to_addrs=recipients)
+            except _SMTP_REFUSED:
+                # Keep the connection; retrying would only be refused again
+                raise
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # The server dropped the idle connection: reconnect once and retry
+                _reset_smtp()
+                try:
+                    server = _get_smtp(_SMTP_CONFIG)
+                    server.send_message(msg, from_addr=_MAIL_FROM, to_addrs=recipients)
+                except _SMTP_REFUSED:
+                    raise
+                except (smtplib.SMTPException, OSError):
+                    # Never keep a connection that failed mid-send
+                    _reset_smtp(graceful=False)
+                    raise
+            except (smtplib.SMTPException, OSError):
+                # Timed out or failed mid-send: drop the connection without waiting on QUIT, and give up
+                _reset_smtp(graceful=False)
+                raise
         
         logger.info(f"Email sent successfully to {to}")
     except Exception as e:
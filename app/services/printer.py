@@ -1,101 +1,283 @@
 import logging
 import json
 import io
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 import asyncio
-from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import concurrent.futures
+import concurrent.futures.process
+import functools
+import multiprocessing
+import reportlab
+from reportlab import rl_config
+
+from app.config.settings import settings
+
+# Configure ReportLab before its modules are imported, since some read rl_config at import time.
+# Shape checking validates every attribute assignment on ReportLab objects; keep it for development only.
+if settings.NODE_ENV != "development":
+    rl_config.shapeChecking = 0
+# Deterministic output (fixed timestamps and document IDs): identical resumes give identical PDFs
+rl_config.invariant = 1
+
 from reportlab.lib.pagesizes import A4, letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm, inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, ListFlowable, ListItem
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate
 from reportlab.pdfgen import canvas
-from reportlab.platypus.flowables import Flowable
 from fastapi import HTTPException, status
 from PIL import Image
 
-from app.config.settings import settings
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _TURBOJPEG = TurboJPEG()
+except (ImportError, OSError):
+    # Package or libjpeg-turbo shared library missing; Pillow encodes previews instead
+    _TURBOJPEG = None
+
 from app.utils.constants import ErrorMessage
 from app.schemas.resume import Resume
 from app.services.storage import storage_service
+from app.services.printer_builders import build_resume_elements
 
 logger = logging.getLogger(__name__)
 
+# The installed ReportLab version can't change while the process runs
+_REPORTLAB_VERSION = f"ReportLab {reportlab.Version}"
+
+
+def _build_styles():
+    """Build the sample stylesheet plus the custom resume paragraph styles"""
+    styles = getSampleStyleSheet()
+    
+    # Heading styles
+    styles.add(ParagraphStyle(
+        name='ResumeHeading',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceAfter=6,
+        alignment=1  # Center alignment
+    ))
+    
+    # Section title style
+    styles.add(ParagraphStyle(
+        name='SectionTitle',
+        parent=styles['Heading2'],
+        fontSize=12,
+        spaceAfter=6,
+        borderWidth=1,
+        borderColor=colors.black,
+        borderPadding=2,
+        borderRadius=None,
+        endDots=None,
+        splitLongWords=1,
+        underlineWidth=0.5,
+        underlineGap=1,
+        underlineOffset=-2,
+        underlineColor=colors.black,
+    ))
+    
+    # Job title style
+    styles.add(ParagraphStyle(
+        name='JobTitle',
+        parent=styles['Normal'],
+        fontSize=10,
+        fontName='Helvetica-Bold',
+        spaceAfter=1
+    ))
+    
+    # Normal text style
+    styles.add(ParagraphStyle(
+        name='ResumeNormal',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=2
+    ))
+    
+    # Contact info style
+    styles.add(ParagraphStyle(
+        name='ContactInfo',
+        parent=styles['Normal'],
+        fontSize=9,
+        alignment=1  # Center alignment
+    ))
+    
+    # Highlights style: bullet in the gutter, wrapped lines hang under the text
+    styles.add(ParagraphStyle(
+        name='ResumeHighlights',
+        parent=styles['ResumeNormal'],
+        leftIndent=10,
+        bulletIndent=0,
+        bulletFontSize=8
+    ))
+    
+    # Date style for the right column of title rows
+    styles.add(ParagraphStyle(
+        name='ResumeDate',
+        parent=styles['ResumeNormal'],
+        alignment=2  # Right alignment
+    ))
+    
+    return styles
+
+
+# getSampleStyleSheet() rebuilds every style, so the stylesheet is built once per process
+_STYLES = _build_styles()
+
+# Page margins shared by every generated document
+_DOC_MARGINS = {
+    'leftMargin': 15 * mm,
+    'rightMargin': 15 * mm,
+    'topMargin': 15 * mm,
+    'bottomMargin': 15 * mm,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _page_size(width: float, height: float) -> Tuple[float, float]:
+    """Page size in points for a layout size in millimetres"""
+    return (width * mm, height * mm)
+
+
+class _ResumeDocTemplate(BaseDocTemplate):
+    """
+    Single-frame document template whose page template is built once per page size.
+    SimpleDocTemplate recomputes its frame and page templates on every build().
+    """
+
+    def __init__(self, pagesize: Tuple[float, float]):
+        super().__init__(None, pagesize=pagesize, **_DOC_MARGINS)
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='normal')
+        self.addPageTemplates([PageTemplate(id='Resume', frames=[frame], pagesize=pagesize)])
+
+
+@functools.lru_cache(maxsize=8)
+def _doc_template(pagesize: Tuple[float, float]) -> _ResumeDocTemplate:
+    """
+    Document template for a page size, reused across renders via build(..., filename=buffer).
+    Only used inside the single-threaded PDF worker processes, so builds never overlap.
+    """
+    return _ResumeDocTemplate(pagesize)
+
+
+class _PreparedResume(NamedTuple):
+    """
+    Resume data with its nested metadata lookups resolved once.
+    Shared by the PDF, preview and batch paths, and picklable for the worker pool.
+    """
+    data: dict
+    layout: list
+    pagesize: Tuple[float, float]
+
+
+# Default layout when a resume has none: a single A4 page
+_DEFAULT_LAYOUT = [{'width': 210, 'height': 297}]
+
+
+def _prepare_resume(resume: Resume) -> _PreparedResume:
+    """Resolve a resume's data, layout and first page size"""
+    resume_data = resume.data if isinstance(resume.data, dict) else resume.data.model_dump()
+    layout = resume_data.get('metadata', {}).get('layout') or _DEFAULT_LAYOUT
+    # Missing dimensions default to A4 (210 x 297 mm)
+    pagesize = _page_size(layout[0].get('width', 210), layout[0].get('height', 297))
+    return _PreparedResume(resume_data, layout, pagesize)
+
+
+# ReportLab layout and preview rasterization are CPU-bound and hold the GIL,
+# so they run in worker processes instead of threads. Started by the app lifespan.
+_PDF_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def start_pdf_pool() -> None:
+    """
+    Start the PDF worker processes.
+    Workers are spawned, not forked: the server process holds threadpool threads, pooled
+    DB sockets and logging locks that a forked child could inherit mid-use.
+    """
+    global _PDF_POOL
+    if _PDF_POOL is None:
+        _PDF_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=settings.PDF_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the PDF worker processes"""
+    global _PDF_POOL
+    if _PDF_POOL is not None:
+        _PDF_POOL.shutdown(wait=False, cancel_futures=True)
+        _PDF_POOL = None
+
+
+def _pdf_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """The running PDF worker pool, started on demand outside the app lifespan (e.g. scripts)"""
+    if _PDF_POOL is None:
+        start_pdf_pool()
+    return _PDF_POOL
+
+
+async def _run_in_pdf_pool(fn: Callable[[_PreparedResume], bytes], prepared: _PreparedResume) -> bytes:
+    """
+    Run a render function in the PDF worker pool.
+    A worker killed mid-render (e.g. OOM on a huge resume) breaks the whole pool,
+    so the pool is restarted and the render retried once.
+    """
+    pool = _pdf_pool()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, fn, prepared)
+    except concurrent.futures.process.BrokenProcessPool:
+        logger.warning("PDF worker pool broken, restarting it")
+        # Concurrent renders see the same broken pool; only the first one replaces it
+        if _PDF_POOL is pool:
+            shutdown_pdf_pool()
+            start_pdf_pool()
+        return await asyncio.get_running_loop().run_in_executor(_pdf_pool(), fn, prepared)
+
+
+def _render_pdf_bytes(prepared: _PreparedResume) -> bytes:
+    """Render the pages of a prepared resume to PDF bytes (runs in a worker process)"""
+    buffer = io.BytesIO()
+    _doc_template(prepared.pagesize).build(build_resume_elements(prepared.data, prepared.layout, _STYLES), filename=buffer)
+    return buffer.getvalue()
+
+
+def _rasterize_first_page(pdf_bytes: bytes) -> bytes:
+    """Render page 1 of a PDF to JPEG bytes, or return the PDF itself without pypdfium2"""
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        logger.warning("pypdfium2 not installed, using PDF as preview")
+        return pdf_bytes
+
+    # PDFium renders in-process, no Poppler subprocess or temporary files
+    pdf = pdfium.PdfDocument(pdf_bytes)
+    try:
+        bitmap = pdf[0].render(scale=150 / 72)
+
+        if _TURBOJPEG is not None:
+            # libjpeg-turbo's SIMD encoder, fed PDFium's native BGR buffer directly
+            return _TURBOJPEG.encode(bitmap.to_numpy(), quality=80, pixel_format=TJPF_BGR)
+
+        img_byte_arr = io.BytesIO()
+        bitmap.to_pil().save(img_byte_arr, format='JPEG', quality=80)
+        return img_byte_arr.getvalue()
+    finally:
+        pdf.close()
+
+
+def _render_preview_bytes(prepared: _PreparedResume) -> bytes:
+    """Render the first page of a prepared resume to JPEG bytes (runs in a worker process)"""
+    return _rasterize_first_page(_render_pdf_bytes(prepared._replace(layout=prepared.layout[:1])))
+
+
 class PrinterService:
     """
     Service for generating PDF and preview images of resumes using ReportLab.
     This maintains the same interface as the original implementation.
     """
-    def __init__(self):
-        """Initialize the service with template environment."""
-        # Setup Jinja2 template environment for any HTML content rendering
-        self.template_dir = Path(__file__).parent / "../templates"
-        self.template_env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
-        
-        # Create templates directory if it doesn't exist
-        self.template_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize styles
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles for PDF generation"""
-        # Heading styles
-        self.styles.add(ParagraphStyle(
-            name='ResumeHeading',
-            parent=self.styles['Heading1'],
-            fontSize=16,
-            spaceAfter=6,
-            alignment=1  # Center alignment
-        ))
-        
-        # Section title style
-        self.styles.add(ParagraphStyle(
-            name='SectionTitle',
-            parent=self.styles['Heading2'],
-            fontSize=12,
-            spaceAfter=6,
-            borderWidth=1,
-            borderColor=colors.black,
-            borderPadding=2,
-            borderRadius=None,
-            endDots=None,
-            splitLongWords=1,
-            underlineWidth=0.5,
-            underlineGap=1,
-            underlineOffset=-2,
-            underlineColor=colors.black,
-        ))
-        
-        # Job title style
-        self.styles.add(ParagraphStyle(
-            name='JobTitle',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            fontName='Helvetica-Bold',
-            spaceAfter=1
-        ))
-        
-        # Normal text style
-        self.styles.add(ParagraphStyle(
-            name='ResumeNormal',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            spaceAfter=2
-        ))
-        
-        # Contact info style
-        self.styles.add(ParagraphStyle(
-            name='ContactInfo',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            alignment=1  # Center alignment
-        ))
+    # Shared, read-only stylesheet
+    styles = _STYLES
 
     async def get_browser(self):
         """
@@ -108,8 +290,7 @@ class PrinterService:
         """
         Get ReportLab version for compatibility with original interface.
         """
-        import reportlab
-        return f"ReportLab {reportlab.Version}"
+        return _REPORTLAB_VERSION
 
     async def print_resume(self, resume: Resume) -> str:
         """
@@ -124,13 +305,13 @@ class PrinterService:
         start_time = asyncio.get_event_loop().time()
 
         try:
-            url = await self._generate_resume(resume)
+            prepared = _prepare_resume(resume)
+            url = await self._generate_resume(resume, prepared)
 
             end_time = asyncio.get_event_loop().time()
             duration = int((end_time - start_time) * 1000)
 
-            # Access dictionary with .get() method rather than attribute access
-            number_pages = len(resume.data.get('metadata', {}).get('layout', []))
+            number_pages = len(prepared.layout)
             logger.debug(f"ReportLab took {duration}ms to print {number_pages} page(s)")
 
             return url
@@ -154,7 +335,7 @@ class PrinterService:
         start_time = asyncio.get_event_loop().time()
 
         try:
-            url = await self._generate_preview(resume)
+            url = await self._generate_preview(resume, _prepare_resume(resume))
 
             end_time = asyncio.get_event_loop().time()
             duration = int((end_time - start_time) * 1000)
@@ -169,276 +350,22 @@ class PrinterService:
                 detail=ErrorMessage.RESUME_PRINTER_ERROR
             )
 
-    def _get_page_size(self, layout):
-        """Get page size for the given layout"""
-        width = layout.get('width', 210)  # Default A4 width in mm
-        height = layout.get('height', 297)  # Default A4 height in mm
-        return (width * mm, height * mm)
-
-    def _build_header(self, resume_data):
-        """Build the header section with name and contact info"""
-        elements = []
-        
-        # Name
-        basics = resume_data.get('basics', {})
-        name = basics.get('name', '')
-        elements.append(Paragraph(name, self.styles['ResumeHeading']))
-        elements.append(Spacer(1, 2 * mm))
-        
-        # Contact info
-        contact_parts = []
-        
-        if 'email' in basics:
-            contact_parts.append(basics['email'])
-        
-        if 'phone' in basics:
-            contact_parts.append(basics['phone'])
-        
-        if 'location' in basics:
-            location = basics['location']
-            if 'city' in location and 'region' in location:
-                contact_parts.append(f"{location['city']}, {location['region']}")
-        
-        if contact_parts:
-            contact_info = " | ".join(contact_parts)
-            elements.append(Paragraph(contact_info, self.styles['ContactInfo']))
-            elements.append(Spacer(1, 6 * mm))
-        
-        return elements
-
-    def _build_work_section(self, work_items):
-        """Build work experience section"""
-        elements = []
-        
-        for job in work_items:
-            # Company and dates row
-            job_header = f"<b>{job.get('position', '')}</b> - {job.get('company', '')}"
-            date_range = f"{job.get('startDate', '')} - {job.get('endDate', 'Present')}"
-            
-            elements.append(
-                Table(
-                    [[Paragraph(job_header, self.styles['JobTitle']), 
-                      Paragraph(date_range, self.styles['ResumeNormal'])]],
-                    colWidths=['70%', '30%'],
-                    style=TableStyle([
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-                    ])
-                )
-            )
-            
-            # Summary
-            if 'summary' in job and job['summary']:
-                elements.append(Paragraph(job['summary'], self.styles['ResumeNormal']))
-            
-            # Highlights
-            if 'highlights' in job and job['highlights']:
-                highlight_items = []
-                for highlight in job['highlights']:
-                    highlight_items.append(ListItem(Paragraph(highlight, self.styles['ResumeNormal'])))
-                
-                elements.append(ListFlowable(
-                    highlight_items,
-                    bulletType='bullet',
-                    start=None,
-                    bulletFontSize=8,
-                    leftIndent=10,
-                    bulletOffsetY=1
-                ))
-            
-            elements.append(Spacer(1, 3 * mm))
-        
-        return elements
-
-    def _build_education_section(self, education_items):
-        """Build education section"""
-        elements = []
-        
-        for edu in education_items:
-            # Institution and dates row
-            elements.append(
-                Table(
-                    [[Paragraph(f"<b>{edu.get('institution', '')}</b>", self.styles['JobTitle']), 
-                      Paragraph(f"{edu.get('startDate', '')} - {edu.get('endDate', 'Present')}", self.styles['ResumeNormal'])]],
-                    colWidths=['70%', '30%'],
-                    style=TableStyle([
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-                    ])
-                )
-            )
-            
-            # Degree
-            if 'area' in edu and 'studyType' in edu:
-                elements.append(Paragraph(f"{edu['area']}, {edu['studyType']}", self.styles['ResumeNormal']))
-            
-            elements.append(Spacer(1, 3 * mm))
-        
-        return elements
-
-    def _build_skills_section(self, skills_items):
-        """Build skills section"""
-        elements = []
-        
-        data = []
-        row = []
-        
-        for i, skill in enumerate(skills_items):
-            # Create skill cell
-            skill_text = f"<b>{skill.get('name', '')}</b>"
-            if 'keywords' in skill and skill['keywords']:
-                skill_text += f"<br/>{', '.join(skill['keywords'])}"
-            
-            skill_cell = Paragraph(skill_text, self.styles['ResumeNormal'])
-            row.append(skill_cell)
-            
-            # Create a new row after every 2 skills or at the end
-            if (i + 1) % 2 == 0 or i == len(skills_items) - 1:
-                # If odd number of skills, add empty cell to complete row
-                if i == len(skills_items) - 1 and (i + 1) % 2 != 0:
-                    row.append('')
-                data.append(row)
-                row = []
-        
-        if data:
-            skill_table = Table(
-                data,
-                colWidths=['50%', '50%'],
-                style=TableStyle([
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-                ])
-            )
-            elements.append(skill_table)
-            elements.append(Spacer(1, 3 * mm))
-        
-        return elements
-
-    def _build_projects_section(self, projects_items):
-        """Build projects section"""
-        elements = []
-        
-        for project in projects_items:
-            # Project name and dates row
-            project_header = f"<b>{project.get('name', '')}</b>"
-            date_range = ""
-            if 'startDate' in project and 'endDate' in project:
-                date_range = f"{project['startDate']} - {project['endDate']}"
-            
-            elements.append(
-                Table(
-                    [[Paragraph(project_header, self.styles['JobTitle']), 
-                      Paragraph(date_range, self.styles['ResumeNormal'])]],
-                    colWidths=['70%', '30%'],
-                    style=TableStyle([
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-                    ])
-                )
-            )
-            
-            # Description
-            if 'description' in project and project['description']:
-                elements.append(Paragraph(project['description'], self.styles['ResumeNormal']))
-            
-            # Highlights
-            if 'highlights' in project and project['highlights']:
-                highlight_items = []
-                for highlight in project['highlights']:
-                    highlight_items.append(ListItem(Paragraph(highlight, self.styles['ResumeNormal'])))
-                
-                elements.append(ListFlowable(
-                    highlight_items,
-                    bulletType='bullet',
-                    start=None,
-                    bulletFontSize=8,
-                    leftIndent=10,
-                    bulletOffsetY=1
-                ))
-            
-            elements.append(Spacer(1, 3 * mm))
-        
-        return elements
-
-    async def _generate_resume(self, resume: Resume) -> str:
+    async def _generate_resume(self, resume: Resume, prepared: _PreparedResume) -> str:
         """
         Generate a PDF for a resume using ReportLab.
         
         Args:
             resume: Resume object
+            prepared: Resume data and layout from _prepare_resume
 
         Returns:
             URL of the generated PDF
         """
-        buffer = io.BytesIO()
-        
-        # Get resume data as dict
-        resume_data = resume.data if isinstance(resume.data, dict) else resume.data.dict()
-        metadata = resume_data.get('metadata', {})
-        layout = metadata.get('layout', [{'width': 210, 'height': 297}])  # Default to A4 if no layout
-        
-        # Get first page size as default
-        first_page_size = self._get_page_size(layout[0])
-        
-        # Create the PDF document
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=first_page_size,
-            leftMargin=15*mm,
-            rightMargin=15*mm,
-            topMargin=15*mm,
-            bottomMargin=15*mm
-        )
-
-        # Build resume content
-        elements = []
+        # Build the PDF in a worker process so concurrent print jobs use every core
+        pdf_bytes = await _run_in_pdf_pool(_render_pdf_bytes, prepared)
         
-        # Process each page
-        for page_index, page_layout in enumerate(layout):
-            if page_index == 0:
-                # Add header only on first page
-                elements.extend(self._build_header(resume_data))
-            
-            # Process sections for this page
-            for section in resume_data.get('sections', []):
-                if section.get('page', 1) == page_index + 1:  # Pages are 1-indexed in data
-                    # Add section title
-                    elements.append(Paragraph(section.get('title', ''), self.styles['SectionTitle']))
-                    elements.append(Spacer(1, 2 * mm))
-                    
-                    # Add section content based on type
-                    if section.get('type') == 'work' and 'work' in resume_data:
-                        elements.extend(self._build_work_section(resume_data['work']))
-                        
-                    elif section.get('type') == 'education' and 'education' in resume_data:
-                        elements.extend(self._build_education_section(resume_data['education']))
-                        
-                    elif section.get('type') == 'skills' and 'skills' in resume_data:
-                        elements.extend(self._build_skills_section(resume_data['skills']))
-                        
-                    elif section.get('type') == 'projects' and 'projects' in resume_data:
-                        elements.extend(self._build_projects_section(resume_data['projects']))
-                        
-                    elif section.get('type') == 'custom' and 'content' in section:
-                        # For custom sections, we'd need to convert HTML to ReportLab elements
-                        # For simplicity, just adding as-is with some basic HTML support
-                        elements.append(Paragraph(section['content'], self.styles['ResumeNormal']))
-                        elements.append(Spacer(1, 3 * mm))
-            
-            # Add page break after each page except the last
-            if page_index < len(layout) - 1:
-                elements.append(Flowable.PageBreak())
-        
-        # Build the PDF
-        doc.build(elements)
-        
-        # Get PDF bytes
-        buffer.seek(0)
-        pdf_bytes = buffer.getvalue()
-        
-        # Upload the PDF to storage
-        url = storage_service.upload_object(
+        # Upload the PDF to storage (file I/O, kept off the event loop)
+        url = await storage_service.upload_object_async(
             user_id=resume.userId,
             type_="resumes",
             file_data=pdf_bytes,
@@ -447,96 +374,22 @@ class PrinterService:
         
         return url
 
-    async def _generate_preview(self, resume: Resume) -> str:
+    async def _generate_preview(self, resume: Resume, prepared: _PreparedResume) -> str:
         """
         Generate a preview image for a resume using ReportLab and Pillow.
         
         Args:
             resume: Resume object
+            prepared: Resume data and layout from _prepare_resume
             
         Returns:
             URL of the generated preview
         """
-        # Generate PDF first
-        buffer = io.BytesIO()
-        
-        # Get resume data as dict
-        resume_data = resume.data if isinstance(resume.data, dict) else resume.data.dict()
-        metadata = resume_data.get('metadata', {})
-        layout = metadata.get('layout', [{'width': 210, 'height': 297}])  # Default to A4 if no layout
-        
-        # Get first page size
-        first_page_size = self._get_page_size(layout[0])
-        
-        # Create the PDF document - first page only
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=first_page_size,
-            leftMargin=15*mm,
-            rightMargin=15*mm,
-            topMargin=15*mm,
-            bottomMargin=15*mm
-        )
-
-        # Build resume content for first page
-        elements = []
-        
-        # Add header
-        elements.extend(self._build_header(resume_data))
-        
-        # Process sections for first page only
-        for section in resume_data.get('sections', []):
-            if section.get('page', 1) == 1:  # Only first page
-                # Add section title
-                elements.append(Paragraph(section.get('title', ''), self.styles['SectionTitle']))
-                elements.append(Spacer(1, 2 * mm))
-                
-                # Add section content based on type
-                if section.get('type') == 'work' and 'work' in resume_data:
-                    elements.extend(self._build_work_section(resume_data['work']))
-                    
-                elif section.get('type') == 'education' and 'education' in resume_data:
-                    elements.extend(self._build_education_section(resume_data['education']))
-                    
-                elif section.get('type') == 'skills' and 'skills' in resume_data:
-                    elements.extend(self._build_skills_section(resume_data['skills']))
-                    
-                elif section.get('type') == 'projects' and 'projects' in resume_data:
-                    elements.extend(self._build_projects_section(resume_data['projects']))
-                    
-                elif section.get('type') == 'custom' and 'content' in section:
-                    elements.append(Paragraph(section['content'], self.styles['ResumeNormal']))
-                    elements.append(Spacer(1, 3 * mm))
-        
-        # Build the PDF
-        doc.build(elements)
-        
-        # Get PDF bytes
-        buffer.seek(0)
-        pdf_bytes = buffer.getvalue()
-        
-        # Convert PDF to JPEG image using pdf2image
-        try:
-            from pdf2image import convert_from_bytes
-            
-            images = convert_from_bytes(
-                pdf_bytes, 
-                dpi=150,
-                first_page=1,
-                last_page=1
-            )
-            
-            img_byte_arr = io.BytesIO()
-            images[0].save(img_byte_arr, format='JPEG', quality=80)
-            img_byte_arr.seek(0)
-            screenshot = img_byte_arr.getvalue()
-            
-        except ImportError:
-            logger.warning("pdf2image not installed, using PDF as preview")
-            screenshot = pdf_bytes
+        # Build the first page and rasterize it in a worker process
+        screenshot = await _run_in_pdf_pool(_render_preview_bytes, prepared)
         
-        # Upload the preview image
-        url = storage_service.upload_object(
+        # Upload the preview image (file I/O, kept off the event loop)
+        url = await storage_service.upload_object_async(
             user_id=resume.userId,
             type_="previews",
             file_data=screenshot,
@@ -0,0 +1,246 @@
+"""
+Flowable builders for resume PDFs.
+
+Plain, fully annotated functions with no service state, so the section
+assembly can be profiled, reused by the worker processes, and compiled
+ahead of time (e.g. with mypyc) without touching the printer service.
+Import through app.services.printer, which configures rl_config first.
+"""
+import copy
+import functools
+from typing import Any, Callable, Dict, List
+
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1
+from reportlab.lib.units import mm
+from reportlab.platypus import PageBreak, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus.flowables import Flowable
+
+
+class TitleRow(Flowable):
+    """
+    Title on the left with a right-aligned date on the same line.
+    Replaces a one-row Table: two Paragraphs side by side, no table style resolution.
+    """
+
+    def __init__(self, title: str, date: str, title_style: ParagraphStyle, date_style: ParagraphStyle):
+        super().__init__()
+        self._title = Paragraph(title, title_style)
+        self._date = Paragraph(date, date_style) if date else None
+
+    def wrap(self, availWidth: float, availHeight: float):
+        # Keep the 70/30 columns of the old table layout; a long date wraps in its column
+        _, title_height = self._title.wrap(availWidth * 0.7, availHeight)
+        date_height = self._date.wrap(availWidth * 0.3, availHeight)[1] if self._date else 0
+        self.width = availWidth
+        self.height = max(title_height, date_height)
+        return self.width, self.height
+
+    def draw(self) -> None:
+        self._title.drawOn(self.canv, 0, self.height - self._title.height)
+        if self._date:
+            self._date.drawOn(self.canv, self.width * 0.7, self.height - self._date.height)
+
+
+@functools.lru_cache(maxsize=1024)
+def _contact_paragraph(contact_info: str, style: ParagraphStyle) -> Paragraph:
+    """Parse the contact line once per distinct text; the same basics recur across previews and prints"""
+    return Paragraph(contact_info, style)
+
+
+def build_header(resume_data: Dict[str, Any], styles: StyleSheet1) -> List[Flowable]:
+    """Build the header section with name and contact info"""
+    elements: List[Flowable] = []
+
+    # Name
+    basics = resume_data.get('basics', {})
+    name = basics.get('name', '')
+    elements.append(Paragraph(name, styles['ResumeHeading']))
+    elements.append(Spacer(1, 2 * mm))
+
+    # Contact info
+    contact_parts: List[str] = []
+
+    if 'email' in basics:
+        contact_parts.append(basics['email'])
+
+    if 'phone' in basics:
+        contact_parts.append(basics['phone'])
+
+    if 'location' in basics:
+        location = basics['location']
+        if 'city' in location and 'region' in location:
+            contact_parts.append(f"{location['city']}, {location['region']}")
+
+    if contact_parts:
+        contact_info = " | ".join(contact_parts)
+        # Layout state (width, height, line breaks) is set on the copy by wrap(), so the
+        # cached, already-parsed original is never touched by a document build
+        elements.append(copy.copy(_contact_paragraph(contact_info, styles['ContactInfo'])))
+        elements.append(Spacer(1, 6 * mm))
+
+    return elements
+
+
+def build_highlights(highlights: List[str], styles: StyleSheet1) -> List[Paragraph]:
+    """Build an item's highlights as bulleted paragraphs with a hanging indent"""
+    # bulletText gives each Paragraph its own bullet, without a ListItem/ListFlowable wrapper per item
+    style = styles['ResumeHighlights']
+    return [Paragraph(highlight, style, bulletText="•") for highlight in highlights]
+
+
+def build_work_section(work_items: List[Dict[str, Any]], styles: StyleSheet1) -> List[Flowable]:
+    """Build work experience section"""
+    elements: List[Flowable] = []
+
+    for job in work_items:
+        # Company and dates row
+        # JobTitle is already bold, so the header needs no <b> markup
+        job_header = f"{job.get('position', '')} - {job.get('company', '')}"
+        date_range = f"{job.get('startDate', '')} - {job.get('endDate', 'Present')}"
+
+        elements.append(TitleRow(job_header, date_range, styles['JobTitle'], styles['ResumeDate']))
+
+        # Summary
+        if 'summary' in job and job['summary']:
+            elements.append(Paragraph(job['summary'], styles['ResumeNormal']))
+
+        # Highlights
+        if 'highlights' in job and job['highlights']:
+            elements.extend(build_highlights(job['highlights'], styles))
+
+        elements.append(Spacer(1, 3 * mm))
+
+    return elements
+
+
+def build_education_section(education_items: List[Dict[str, Any]], styles: StyleSheet1) -> List[Flowable]:
+    """Build education section"""
+    elements: List[Flowable] = []
+
+    for edu in education_items:
+        # Institution and dates row
+        elements.append(TitleRow(
+            edu.get('institution', ''),
+            f"{edu.get('startDate', '')} - {edu.get('endDate', 'Present')}",
+            styles['JobTitle'],
+            styles['ResumeDate']
+        ))
+
+        # Degree
+        if 'area' in edu and 'studyType' in edu:
+            elements.append(Paragraph(f"{edu['area']}, {edu['studyType']}", styles['ResumeNormal']))
+
+        elements.append(Spacer(1, 3 * mm))
+
+    return elements
+
+
+def _skill_cell(skill: Dict[str, Any], styles: StyleSheet1) -> Paragraph:
+    """Skill name in bold with its keywords on the next line"""
+    skill_text = f"<b>{skill.get('name', '')}</b>"
+    if 'keywords' in skill and skill['keywords']:
+        skill_text += f"<br/>{', '.join(skill['keywords'])}"
+    return Paragraph(skill_text, styles['ResumeNormal'])
+
+
+def build_skills_section(skills_items: List[Dict[str, Any]], styles: StyleSheet1) -> List[Flowable]:
+    """Build skills section"""
+    elements: List[Flowable] = []
+
+    # One cell per skill, padded to an even count, then sliced into two-column rows
+    cells: List[Any] = [_skill_cell(skill, styles) for skill in skills_items]
+    if len(cells) % 2:
+        cells.append('')
+    data = [cells[i:i + 2] for i in range(0, len(cells), 2)]
+
+    if data:
+        skill_table = Table(
+            data,
+            colWidths=['50%', '50%'],
+            style=TableStyle([
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ('LEFTPADDING', (0, 0), (-1, -1), 0),
+                ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+            ])
+        )
+        elements.append(skill_table)
+        elements.append(Spacer(1, 3 * mm))
+
+    return elements
+
+
+def build_projects_section(projects_items: List[Dict[str, Any]], styles: StyleSheet1) -> List[Flowable]:
+    """Build projects section"""
+    elements: List[Flowable] = []
+
+    for project in projects_items:
+        # Project name and dates row
+        project_header = project.get('name', '')
+        date_range = ""
+        if 'startDate' in project and 'endDate' in project:
+            date_range = f"{project['startDate']} - {project['endDate']}"
+
+        elements.append(TitleRow(project_header, date_range, styles['JobTitle'], styles['ResumeDate']))
+
+        # Description
+        if 'description' in project and project['description']:
+            elements.append(Paragraph(project['description'], styles['ResumeNormal']))
+
+        # Highlights
+        if 'highlights' in project and project['highlights']:
+            elements.extend(build_highlights(project['highlights'], styles))
+
+        elements.append(Spacer(1, 3 * mm))
+
+    return elements
+
+
+# Section type -> builder for the matching top-level resume data list
+SECTION_BUILDERS: Dict[str, Callable[[List[Dict[str, Any]], StyleSheet1], List[Flowable]]] = {
+    'work': build_work_section,
+    'education': build_education_section,
+    'skills': build_skills_section,
+    'projects': build_projects_section,
+}
+
+
+def build_resume_elements(resume_data: Dict[str, Any], layout: List[Dict[str, Any]], styles: StyleSheet1) -> List[Flowable]:
+    """Build the flowables for every page of one resume"""
+    elements: List[Flowable] = []
+
+    # Partition sections by page once, so each page (and a first-page-only
+    # preview) walks just its own sections. Pages are 1-indexed in data.
+    sections_by_page: Dict[int, List[Dict[str, Any]]] = {}
+    for section in resume_data.get('sections', []):
+        sections_by_page.setdefault(section.get('page', 1), []).append(section)
+
+    # Process each page
+    for page_index in range(len(layout)):
+        if page_index == 0:
+            # Add header only on first page
+            elements.extend(build_header(resume_data, styles))
+
+        # Process sections for this page
+        for section in sections_by_page.get(page_index + 1, ()):
+            # Add section title
+            elements.append(Paragraph(section.get('title', ''), styles['SectionTitle']))
+            elements.append(Spacer(1, 2 * mm))
+
+            # Add section content based on type
+            section_type = section.get('type')
+            builder = SECTION_BUILDERS.get(section_type)
+            if builder is not None:
+                if section_type in resume_data:
+                    elements.extend(builder(resume_data[section_type], styles))
+
+            elif section_type == 'custom' and 'content' in section:
+                # For custom sections, we'd need to convert HTML to ReportLab elements
+                # For simplicity, just adding as-is with some basic HTML support
+                elements.append(Paragraph(section['content'], styles['ResumeNormal']))
+                elements.append(Spacer(1, 3 * mm))
+
+        # Add page break after each page except the last
+        if page_index < len(layout) - 1:
+            elements.append(PageBreak())
+
+    return elements
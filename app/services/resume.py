@@ -2,13 +2,16 @@ import logging
 import uuid
 from typing import Dict, List, Optional, Union
 from datetime import datetime
-from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import BackgroundTasks, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Session, contains_eager
 from sqlalchemy.exc import IntegrityError
 import re
 import json
-import copy
 
+from app.database.db import get_db_context
 from app.models.models import Resume, Statistics, User, Visibility
 from app.schemas.resume import (
     CreateResumeRequest,
@@ -25,44 +28,55 @@ from app.services.storage import storage_service
 
 logger = logging.getLogger(__name__)
 
+# Runs of characters not allowed in a slug
+_SLUGIFY_RE = re.compile(r'[^a-z0-9]+')
 
-# Default resume data - minimal implementation (expand as needed)
-DEFAULT_RESUME_DATA = {
-    "metadata": {
-        "template": "standard",
-        "layout": [["header"], ["core"], ["skills"], ["experience"], ["education"]],
-        "css": {
-            "visible": False,
-            "value": ""
-        }
-    },
-    "basics": {
-        "name": "",
-        "email": "",
-        "phone": "",
-        "website": "",
-        "headline": "",
-        "summary": "",
-        "photo": {}
-    },
-    "sections": {
-        "skills": {
-            "id": "skills",
-            "name": "Skills",
-            "items": []
+
+# Default resume layout, kept immutable and copied into each new resume
+_DEFAULT_LAYOUT = (("header",), ("core",), ("skills",), ("experience",), ("education",))
+
+
+def _default_resume_data(name: str = "", email: str = "", picture: Optional[str] = None) -> Dict:
+    """
+    Default resume data - minimal implementation (expand as needed).
+    Built from literals on each call, which is much cheaper than deep-copying a template.
+    """
+    return {
+        "metadata": {
+            "template": "standard",
+            "layout": [list(column) for column in _DEFAULT_LAYOUT],
+            "css": {
+                "visible": False,
+                "value": ""
+            }
         },
-        "experience": {
-            "id": "experience",
-            "name": "Work Experience",
-            "items": []
+        "basics": {
+            "name": name,
+            "email": email,
+            "phone": "",
+            "website": "",
+            "headline": "",
+            "summary": "",
+            "photo": {"url": picture} if picture else {}
         },
-        "education": {
-            "id": "education", 
-            "name": "Education",
-            "items": []
+        "sections": {
+            "skills": {
+                "id": "skills",
+                "name": "Skills",
+                "items": []
+            },
+            "experience": {
+                "id": "experience",
+                "name": "Work Experience",
+                "items": []
+            },
+            "education": {
+                "id": "education", 
+                "name": "Education",
+                "items": []
+            }
         }
     }
-}
 
 
 def normalize_slug(slug: str) -> str:
@@ -73,7 +87,7 @@ def normalize_slug(slug: str) -> str:
         return str(uuid.uuid4())
     
     # Convert to lowercase and replace non-alphanumeric characters with hyphens
-    normalized = re.sub(r'[^a-z0-9]+', '-', slug.lower()).strip('-')
+    normalized = _SLUGIFY_RE.sub('-', slug.lower()).strip('-')
     
     if not normalized:
         return str(uuid.uuid4())
@@ -101,6 +115,21 @@ def get_resume_by_id(db: Session, resume_id: uuid.UUID, user_id: Optional[uuid.U
     return resume
 
 
+def get_resume_for_print(db: Session, resume_id: uuid.UUID, user_id: Optional[uuid.UUID] = None) -> Resume:
+    """
+    Get a resume that the given user may print: either one they own or a public one.
+    """
+    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    
+    if not resume or (resume.userId != user_id and resume.visibility != "public"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ErrorMessage.RESUME_NOT_FOUND
+        )
+    
+    return resume
+
+
 def create_resume(db: Session, user_id: uuid.UUID, create_data: CreateResumeRequest) -> Resume:
     """
     Create a new resume.
@@ -114,14 +143,8 @@ def create_resume(db: Session, user_id: uuid.UUID, create_data: CreateResumeRequ
             detail=ErrorMessage.USER_NOT_FOUND
         )
     
-    # Initialize with default resume data
-    data = copy.deepcopy(DEFAULT_RESUME_DATA)
-    
-    # Prefill user info
-    data["basics"]["name"] = user.name
-    data["basics"]["email"] = user.email
-    if user.picture:
-        data["basics"]["photo"] = {"url": user.picture}
+    # Initialize with default resume data, prefilled with user info
+    data = _default_resume_data(user.name, user.email, user.picture)
     
     # Generate slug if not provided
     slug = create_data.slug
@@ -176,7 +199,7 @@ def import_resume(db: Session, user_id: uuid.UUID, import_data: ImportResumeRequ
             title=title,
             slug=slug,
             visibility="private",
-            data=import_data.data.dict()
+            data=import_data.data.model_dump()
         )
         
         db.add(resume)
@@ -192,24 +215,63 @@ def import_resume(db: Session, user_id: uuid.UUID, import_data: ImportResumeRequ
         )
 
 
-def get_all_resumes(db: Session, user_id: uuid.UUID) -> List[Resume]:
+def get_all_resumes(db: Session, user_id: uuid.UUID) -> List[RowMapping]:
+    """
+    Get all resumes for a user, without their data.
+    Selects just the ResumeSummary columns as plain row mappings: the data JSON is the
+    bulk of each row, and list rows need no ORM identity map or attribute instrumentation.
+    """
+    stmt = (
+        select(
+            Resume.id, Resume.userId, Resume.title, Resume.slug, Resume.visibility,
+            Resume.locked, Resume.createdAt, Resume.updatedAt,
+        )
+        .where(Resume.userId == user_id)
+        .order_by(Resume.updatedAt.desc())
+    )
+    return db.execute(stmt).mappings().all()
+
+
+def _statistics_upsert(resume_id: uuid.UUID, counter: str):
     """
-    Get all resumes for a user.
+    INSERT ... ON CONFLICT statement that adds one to a resume's views or downloads counter.
     """
-    resumes = db.query(Resume).filter(Resume.userId == user_id).order_by(Resume.updatedAt.desc()).all()
-    return resumes
+    values = {"resumeId": resume_id, "views": 0, "downloads": 0}
+    values[counter] = 1
+    return (
+        pg_insert(Statistics)
+        .values(**values)
+        .on_conflict_do_update(
+            index_elements=[Statistics.resumeId],
+            # onupdate defaults don't fire inside ON CONFLICT, so bump updatedAt here
+            set_={counter: Statistics.__table__.c[counter] + 1, "updatedAt": datetime.utcnow()},
+        )
+    )
+
+
+def _increment_statistics(db: Session, resume_id: uuid.UUID, counter: str) -> None:
+    """
+    Add one to a resume's views or downloads counter in a single upsert round trip.
+    Failures are logged and rolled back; statistics must never fail the request.
+    """
+    try:
+        db.execute(_statistics_upsert(resume_id, counter))
+        db.commit()
+    except Exception as e:
+        logger.error(f"Error updating statistics: {e}")
+        db.rollback()
 
 
 def get_resume_by_username_slug(db: Session, username: str, slug: str, user_id: Optional[uuid.UUID] = None) -> Resume:
     """
     Get a public resume by username and slug.
     """
+    # Hydrate resume.user from the joined row so later access doesn't issue another SELECT
     resume = (
         db.query(Resume)
-        .join(User)
-        .filter(User.username == username)
-        .filter(Resume.slug == slug)
-        .filter(Resume.visibility == "public")
+        .join(Resume.user)
+        .options(contains_eager(Resume.user))
+        .filter(User.username == username, Resume.slug == slug, Resume.visibility == "public")
         .first()
     )
     
@@ -221,21 +283,7 @@ def get_resume_by_username_slug(db: Session, username: str, slug: str, user_id:
     
     # Update statistics if the viewer is not the owner
     if not user_id or user_id != resume.userId:
-        try:
-            # Check if statistics exist
-            stats = db.query(Statistics).filter(Statistics.resumeId == resume.id).first()
-            
-            if stats:
-                stats.views += 1
-            else:
-                stats = Statistics(resumeId=resume.id, views=1, downloads=0)
-                db.add(stats)
-            
-            db.commit()
-        except Exception as e:
-            logger.error(f"Error updating statistics: {e}")
-            # Don't fail the request if statistics update fails
-            db.rollback()
+        _increment_statistics(db, resume.id, "views")
     
     return resume
 
@@ -281,7 +329,7 @@ def update_resume(
             resume.slug = normalize_slug(update_data.slug)
         
         if update_data.data is not None:
-            resume.data = update_data.data.dict()
+            resume.data = update_data.data.model_dump()
         
         resume.updatedAt = datetime.utcnow()
         
@@ -320,7 +368,8 @@ def delete_resume(db: Session, user_id: uuid.UUID, resume_id: uuid.UUID) -> None
     
     # Delete storage files for this resume
     try:
-        storage_service.delete_object(user_id, "resumes", str(resume_id))
+        # Same filename the printer uploads under (storage appends ".pdf" again)
+        storage_service.delete_object(user_id, "resumes", f"{resume.slug}.pdf")
         storage_service.delete_object(user_id, "previews", str(resume_id))
     except Exception as e:
         logger.error(f"Error deleting resume files from storage: {e}")
@@ -331,7 +380,21 @@ def delete_resume(db: Session, user_id: uuid.UUID, resume_id: uuid.UUID) -> None
     db.commit()
 
 
-async def print_resume(db: Session, resume: Resume, user_id: Optional[uuid.UUID] = None) -> str:
+def _increment_downloads(resume_id: uuid.UUID) -> None:
+    """
+    Count a download in its own short-lived session, for use as a background task
+    after the request's session has been closed.
+    """
+    with get_db_context() as db:
+        _increment_statistics(db, resume_id, "downloads")
+
+
+async def print_resume(
+    db: Session,
+    resume: Resume,
+    user_id: Optional[uuid.UUID] = None,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> str:
     """
     Generate a PDF for a resume.
     
@@ -339,6 +402,7 @@ async def print_resume(db: Session, resume: Resume, user_id: Optional[uuid.UUID]
         db: Database session
         resume: Resume object
         user_id: User ID (if not provided, increments download count)
+        background_tasks: If given, the download count is updated after the response is sent
         
     Returns:
         URL of the generated PDF
@@ -348,21 +412,10 @@ async def print_resume(db: Session, resume: Resume, user_id: Optional[uuid.UUID]
     
     # Update statistics if the downloader is not the owner
     if not user_id or user_id != resume.userId:
-        try:
-            # Check if statistics exist
-            stats = db.query(Statistics).filter(Statistics.resumeId == resume.id).first()
-            
-            if stats:
-                stats.downloads += 1
-            else:
-                stats = Statistics(resumeId=resume.id, views=0, downloads=1)
-                db.add(stats)
-            
-            db.commit()
-        except Exception as e:
-            logger.error(f"Error updating statistics: {e}")
-            # Don't fail the request if statistics update fails
-            db.rollback()
+        if background_tasks is not None:
+            background_tasks.add_task(_increment_downloads, resume.id)
+        else:
+            _increment_statistics(db, resume.id, "downloads")
     
     return url
 
@@ -1,9 +1,10 @@
 # app/services/storage.py
+import asyncio
 import logging
 import os
 import shutil
 import uuid
-from typing import Optional, Union
+from typing import BinaryIO, Optional, Union
 from fastapi import HTTPException, status
 from pathlib import Path
 
@@ -12,11 +13,14 @@ from app.utils.constants import ErrorMessage
 
 logger = logging.getLogger(__name__)
 
+# Base URL for stored files, built once instead of per upload
+_STORAGE_URL = f"{settings.public_url}/storage"
+
 class StorageService:
     """
     Service for handling storage operations with local filesystem.
     """
-    def _init_(self):
+    def __init__(self):
         """
         Initialize the storage service.
         """
@@ -53,7 +57,7 @@ class StorageService:
         self,
         user_id: Union[str, uuid.UUID],
         type_: str,  # 'pictures', 'previews', or 'resumes'
-        file_data: bytes,
+        file_data: Union[bytes, bytearray, memoryview, BinaryIO],
         filename: Optional[str] = None
     ) -> str:
         """
@@ -62,7 +66,7 @@ class StorageService:
         Args:
             user_id: User ID
             type_: Type of file ('pictures', 'previews', or 'resumes')
-            file_data: File data as bytes
+            file_data: File data as a bytes-like object, or a binary file object read from its current position
             filename: Original filename (optional)
             
         Returns:
@@ -90,10 +94,15 @@ class StorageService:
         try:
             # Write the file
             with open(filepath, 'wb') as f:
-                f.write(file_data)
+                if hasattr(file_data, "read"):
+                    # Stream file objects in chunks instead of reading them into memory
+                    shutil.copyfileobj(file_data, f)
+                else:
+                    # write() takes any bytes-like object, e.g. a BytesIO.getbuffer() view, without a copy
+                    f.write(file_data)
             
             # Return URL to access the file
-            return f"{settings.PUBLIC_URL}/storage/{str(user_id)}/{type_}/{safe_filename}.{extension}"
+            return f"{_STORAGE_URL}/{user_id}/{type_}/{safe_filename}.{extension}"
         except Exception as e:
             logger.error(f"Error uploading file: {e}")
             raise HTTPException(
@@ -101,6 +110,28 @@ class StorageService:
                 detail="There was an error while uploading the file."
             )
 
+    async def upload_object_async(
+        self,
+        user_id: Union[str, uuid.UUID],
+        type_: str,
+        file_data: Union[bytes, bytearray, memoryview, BinaryIO],
+        filename: Optional[str] = None
+    ) -> str:
+        """
+        Upload an object to storage without blocking the event loop.
+        The blocking file I/O runs in the default thread pool, so several uploads can overlap.
+        
+        Args:
+            user_id: User ID
+            type_: Type of file ('pictures', 'previews', or 'resumes')
+            file_data: File data, as for upload_object
+            filename: Original filename (optional)
+            
+        Returns:
+            URL of the uploaded file
+        """
+        return await asyncio.to_thread(self.upload_object, user_id, type_, file_data, filename)
+
     def delete_object(self, user_id: Union[str, uuid.UUID], type_: str, filename: str) -> None:
         """
         Delete an object from storage.
@@ -119,9 +150,10 @@ class StorageService:
         filepath = os.path.join(self.storage_dir, str(user_id), type_, f"{filename}.{extension}")
         
         try:
-            # Delete the file if it exists
-            if os.path.exists(filepath):
-                os.remove(filepath)
+            # A missing file is already deleted; unlink directly instead of stat-ing first
+            os.remove(filepath)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Error deleting file: {e}")
             raise HTTPException(
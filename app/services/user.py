@@ -1,7 +1,10 @@
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 import logging
+import threading
+import time
 from uuid import UUID
 
 from app.models.models import User, Secrets
@@ -12,6 +15,55 @@ from app.utils.security import get_password_hash
 
 logger = logging.getLogger(__name__)
 
+# Serialized GET /me responses, keyed by SHA-256 of the access token
+ME_CACHE_TTL = 10                 # 10 seconds
+ME_CACHE_MAX_SIZE = 10_000
+_me_cache: Dict[bytes, Tuple[float, str, bytes]] = {}
+_me_cache_lock = threading.Lock()
+
+
+def get_cached_me(token_digest: bytes) -> Optional[bytes]:
+    """
+    Get a cached GET /me response body, if still fresh.
+    """
+    with _me_cache_lock:
+        entry = _me_cache.get(token_digest)
+    
+    if entry and entry[0] > time.time():
+        return entry[2]
+    return None
+
+
+def cache_me(token_digest: bytes, user_id: Union[str, UUID], body: bytes) -> None:
+    """
+    Cache a GET /me response body for ME_CACHE_TTL seconds.
+    """
+    now = time.time()
+    
+    with _me_cache_lock:
+        if len(_me_cache) >= ME_CACHE_MAX_SIZE:
+            for key, (expires_at, _, _) in list(_me_cache.items()):
+                if expires_at <= now:
+                    del _me_cache[key]
+            
+            # Still full: drop the oldest entry
+            if len(_me_cache) >= ME_CACHE_MAX_SIZE:
+                del _me_cache[next(iter(_me_cache))]
+        
+        _me_cache[token_digest] = (now + ME_CACHE_TTL, str(user_id), body)
+
+
+def invalidate_me_cache(user_id: Union[str, UUID]) -> None:
+    """
+    Drop every cached GET /me response for a user.
+    Call after any change to the user row.
+    """
+    user_id = str(user_id)
+    
+    with _me_cache_lock:
+        for key in [key for key, entry in _me_cache.items() if entry[1] == user_id]:
+            del _me_cache[key]
+
 
 def get_user_by_id(db: Session, user_id: Union[str, UUID]) -> Optional[User]:
     """
@@ -34,26 +86,42 @@ def get_user_by_username(db: Session, username: str) -> Optional[User]:
     return db.query(User).filter(User.username == username).first()
 
 
-def get_user_by_identifier(db: Session, identifier: str) -> Optional[User]:
+def _get_user_and_secrets(db: Session, *criteria) -> Tuple[Optional[User], Optional[Secrets]]:
     """
-    Get user by email or username.
+    Get a user and their secrets in a single JOIN query.
     """
-    user = get_user_by_email(db, identifier)
-    if not user:
-        user = get_user_by_username(db, identifier)
-    return user
+    row = (
+        db.query(User, Secrets)
+        .outerjoin(Secrets, Secrets.userId == User.id)
+        .filter(*criteria)
+        .first()
+    )
+    if not row:
+        return None, None
+    
+    return row[0], row[1]
 
 
-def get_user_with_secrets(db: Session, user_id: Union[str, UUID]) -> tuple[User, Optional[Secrets]]:
+def get_user_with_secrets(db: Session, user_id: Union[str, UUID]) -> Tuple[Optional[User], Optional[Secrets]]:
     """
     Get user with secrets by ID.
     """
-    user = get_user_by_id(db, user_id)
-    if not user:
-        return None, None
-    
-    secrets = db.query(Secrets).filter(Secrets.userId == user_id).first()
-    return user, secrets
+    return _get_user_and_secrets(db, User.id == user_id)
+
+
+def get_user_with_secrets_by_email(db: Session, email: str) -> Tuple[Optional[User], Optional[Secrets]]:
+    """
+    Get user with secrets by email.
+    """
+    return _get_user_and_secrets(db, User.email == email)
+
+
+def get_user_with_secrets_by_identifier(db: Session, identifier: str) -> Tuple[Optional[User], Optional[Secrets]]:
+    """
+    Get user with secrets by email or username.
+    Usernames cannot contain "@", so at most one user matches either column.
+    """
+    return _get_user_and_secrets(db, or_(User.email == identifier, User.username == identifier))
 
 
 def create_user(
@@ -115,6 +183,7 @@ def update_user(
 ) -> User:
     """
     Update existing user.
+    A changed email is applied in the same commit and marks the user unverified.
     """
     db_user = get_user_by_id(db, user_id)
     if not db_user:
@@ -146,36 +215,13 @@ def update_user(
         db_user.username = update_data.username
     if update_data.picture:
         db_user.picture = update_data.picture
+    if update_data.email and update_data.email != db_user.email:
+        db_user.email = update_data.email
+        db_user.emailVerified = False
     
     db.commit()
     db.refresh(db_user)
-    
-    return db_user
-
-
-def update_user_email(db: Session, user_id: Union[str, UUID], email: str) -> User:
-    """
-    Update user email and set emailVerified to False.
-    """
-    db_user = get_user_by_id(db, user_id)
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=ErrorMessage.USER_NOT_FOUND
-        )
-    
-    # Check email uniqueness
-    if get_user_by_email(db, email) and email != db_user.email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=ErrorMessage.USER_ALREADY_EXISTS
-        )
-    
-    db_user.email = email
-    db_user.emailVerified = False
-    
-    db.commit()
-    db.refresh(db_user)
+    invalidate_me_cache(user_id)
     
     return db_user
 
@@ -230,5 +276,6 @@ def delete_user(db: Session, user_id: Union[str, UUID]) -> bool:
     
     db.delete(db_user)
     db.commit()
+    invalidate_me_cache(user_id)
     
     return True
\ No newline at end of file
@@ -1,8 +1,11 @@
+import base64
 import hashlib
+import hmac
 import secrets
-import string
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import jwt
 from fastapi import HTTPException, status
@@ -15,6 +18,20 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 15  # 15 minutes
 REFRESH_TOKEN_EXPIRE_DAYS = 2     # 2 days
 
+# Signing keys and decode options are fixed for the process, so build them once
+_TOKEN_KEYS = {
+    "access": settings.ACCESS_TOKEN_SECRET.encode(),
+    "refresh": settings.REFRESH_TOKEN_SECRET.encode(),
+}
+_DECODE_OPTIONS = {"require": ["exp", "sub"]}
+_ALGORITHMS = [ALGORITHM]
+
+# Verified token payloads, keyed by token type and SHA-256 of the token
+TOKEN_CACHE_TTL = 60              # 60 seconds
+TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: Dict[Tuple[str, bytes], Tuple[float, Dict[str, Any]]] = {}
+_token_cache_lock = threading.Lock()
+
 
 def get_password_hash(password: str) -> str:
     """ Hash a password using SHA-256 """
@@ -23,7 +40,7 @@ def get_password_hash(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """ Verify if the hashed password matches the stored hash """
-    return get_password_hash(plain_password) == hashed_password
+    return hmac.compare_digest(get_password_hash(plain_password), hashed_password)
 
 
 def create_token(data: Dict[str, Any], token_type: str, expires_delta: Optional[timedelta] = None) -> str:
@@ -41,24 +58,16 @@ def create_token(data: Dict[str, Any], token_type: str, expires_delta: Optional[
     
     to_encode.update({"exp": expire})
     
-    secret = (
-        settings.ACCESS_TOKEN_SECRET if token_type == "access"
-        else settings.REFRESH_TOKEN_SECRET
-    )
-    
-    encoded_jwt = jwt.encode(to_encode, secret, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _TOKEN_KEYS[token_type], algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def decode_token(token: str, token_type: str) -> Dict[str, Any]:
     """ Decode a JWT token """
-    secret = (
-        settings.ACCESS_TOKEN_SECRET if token_type == "access"
-        else settings.REFRESH_TOKEN_SECRET
-    )
+    secret = _TOKEN_KEYS["access" if token_type == "access" else "refresh"]
     
     try:
-        payload = jwt.decode(token, secret, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, secret, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
         return payload
     except jwt.PyJWTError:
         raise HTTPException(
@@ -68,6 +77,37 @@ def decode_token(token: str, token_type: str) -> Dict[str, Any]:
         )
 
 
+def decode_token_cached(token: str, token_type: str) -> Dict[str, Any]:
+    """ Decode a JWT token, reusing the payload of a recently verified identical token """
+    key = (token_type, hashlib.sha256(token.encode()).digest())
+    now = time.time()
+    
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+    
+    if entry and entry[0] > now:
+        return entry[1]
+    
+    payload = decode_token(token, token_type)
+    
+    # Never keep a payload past the token's own expiry
+    expires_at = min(now + TOKEN_CACHE_TTL, payload.get("exp", now))
+    
+    with _token_cache_lock:
+        if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            for cached_key, (cached_expires_at, _) in list(_token_cache.items()):
+                if cached_expires_at <= now:
+                    del _token_cache[cached_key]
+            
+            # Still full: drop the oldest entry
+            if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+                del _token_cache[next(iter(_token_cache))]
+        
+        _token_cache[key] = (expires_at, payload)
+    
+    return payload
+
+
 def create_access_token(user_id: Union[str, UUID4], is_two_factor_auth: bool = False) -> str:
     """ Create an access token """
     return create_token(
@@ -84,6 +124,11 @@ def create_refresh_token(user_id: Union[str, UUID4], is_two_factor_auth: bool =
     )
 
 
+def hash_token(token: str) -> str:
+    """ Hash a 2FA backup code for storage and lookup """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 def generate_random_token() -> str:
     """ Generate a secure random token for password reset, verification, etc. """
     return secrets.token_urlsafe(32)
@@ -91,10 +136,9 @@ def generate_random_token() -> str:
 
 def generate_random_backup_codes(length: int = 8) -> list:
     """ Generate random backup codes for two-factor authentication """
-    return [generate_random_code() for _ in range(length)]
-
-
-def generate_random_code(length: int = 10) -> str:
-    """ Generate a random alphanumeric code """
-    alphabet = string.ascii_lowercase + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    # One CSPRNG read for all codes; 7 random bytes base32-encode to 10+ characters (50 bits used)
+    raw = secrets.token_bytes(length * 7)
+    return [
+        base64.b32encode(raw[i * 7:(i + 1) * 7]).decode().lower()[:10]
+        for i in range(length)
+    ]
@@ -1,11 +1,16 @@
 import logging
-import time
-from fastapi import FastAPI, Request, Response
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import os
+import re
 from app.config.settings import settings
 from app.database.db import init_db
 from app.api import auth, user, resume, health, feature, contributors
+from app.middlewares.timing import ProcessTimeMiddleware
+from app.services.printer import shutdown_pdf_pool, start_pdf_pool
 
 
 # Configure logging
@@ -15,6 +20,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # create_all introspects every table, so only run it where schema changes are expected
+    if settings.INIT_DB or settings.NODE_ENV in {"development", "test"}:
+        logger.info("Initializing database...")
+        init_db()
+    # Spawn PDF rendering workers (capped by PDF_WORKERS)
+    start_pdf_pool()
+    logger.info("🚀 Server is up and running on port %s", settings.PORT)
+    
+    yield
+    
+    # Release shared HTTP connections
+    await contributors.close_http_client()
+    await health.close_http_client()
+    # Stop PDF rendering workers
+    shutdown_pdf_pool()
+
 # Initialize FastAPI app with standard docs enabled
 app = FastAPI(
     title="Reactive Resume",
@@ -23,10 +47,13 @@ app = FastAPI(
     # Enable standard docs instead of custom
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson serializes nested resume data, datetimes and UUIDs natively
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
-origins = [settings.PUBLIC_URL]
+origins = [settings.public_url]
 if settings.NODE_ENV == "development":
     origins.append("http://localhost:3000")
 
@@ -38,14 +65,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add request processing time middleware
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
+# Compress larger responses (resume JSON, schema, static bundles)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+# Add request processing time header to API responses
+app.add_middleware(ProcessTimeMiddleware, path_prefix="/api/")
 
 # Mount API routes
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
@@ -75,6 +99,40 @@ for directory in directories:
 # Only mount static directories if they exist and have content
 from fastapi.staticfiles import StaticFiles
 
+
+# Build assets whose names change with their content: anything under assets/, or a
+# filename carrying a hash with at least one digit (app.3f9a1c2b.js, index-BkX3a9_Z.css)
+_HASHED_ASSET_RE = re.compile(r"(^|/)assets/|[.-](?=[A-Za-z0-9_-]*\d)[A-Za-z0-9_-]{8,}\.\w+$")
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that lets browsers cache content-hashed build assets forever.
+    Everything else (index.html and other entry files) must be revalidated,
+    so a deploy is picked up on the next load.
+    """
+    def __init__(
+        self,
+        *args,
+        immutable_cache_control: str = "public, max-age=31536000, immutable",
+        default_cache_control: str = "no-cache",
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.immutable_cache_control = immutable_cache_control
+        self.default_cache_control = default_cache_control
+
+    def file_response(self, full_path, *args, **kwargs) -> Response:
+        response = super().file_response(full_path, *args, **kwargs)
+        relative_path = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+        is_hashed = not relative_path.endswith(".html") and _HASHED_ASSET_RE.search(relative_path)
+        response.headers.setdefault(
+            "Cache-Control",
+            self.immutable_cache_control if is_hashed else self.default_cache_control,
+        )
+        return response
+
+
 # Mount storage path only if it exists
 storage_path = settings.LOCAL_STORAGE_PATH
 if os.path.exists(storage_path):
@@ -82,18 +140,11 @@ if os.path.exists(storage_path):
 
 # Mount artboard static files
 if os.path.exists("static/artboard") and os.listdir("static/artboard"):
-    app.mount("/artboard", StaticFiles(directory="static/artboard"), name="artboard")
+    app.mount("/artboard", CachedStaticFiles(directory="static/artboard"), name="artboard")
 
 # Mount client static files - mount this last to avoid path conflicts
 if os.path.exists("static/client") and os.listdir("static/client"):
-    app.mount("/static", StaticFiles(directory="static/client"), name="client")
-
-# Startup event to initialize database
-@app.on_event("startup")
-def startup_event():
-    logger.info("Initializing database...")
-    init_db()
-    logger.info("🚀 Server is up and running on port %s", settings.PORT)
+    app.mount("/static", CachedStaticFiles(directory="static/client"), name="client")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import auth as auth_service
+from app.utils.constants import ErrorMessage
+from app.utils.security import hash_token
+
+EMAIL = "jane@example.com"
+
+
+@pytest.fixture
+def secrets(monkeypatch):
+    """Secrets of a 2FA user; update_user_secrets writes straight back to them"""
+    user = SimpleNamespace(id=uuid.uuid4(), email=EMAIL, twoFactorEnabled=True)
+    user_secrets = SimpleNamespace(twoFactorSecret="JBSWY3DPEHPK3PXP", twoFactorBackupCodes=[])
+
+    def update_user_secrets(db, user_id, update_data):
+        assert user_id == user.id
+        for key, value in update_data.items():
+            setattr(user_secrets, key, value)
+
+    monkeypatch.setattr(auth_service, "get_user_with_secrets_by_email", lambda db, email: (user, user_secrets))
+    monkeypatch.setattr(auth_service, "update_user_secrets", update_user_secrets)
+    return user_secrets
+
+
+def _use(code):
+    return auth_service.use_two_factor_backup_code(None, EMAIL, code)
+
+
+def _assert_rejected(code):
+    with pytest.raises(HTTPException) as exc_info:
+        _use(code)
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == ErrorMessage.INVALID_TWO_FACTOR_BACKUP_CODE
+
+
+def test_hashed_backup_code_is_accepted_once(secrets):
+    secrets.twoFactorBackupCodes = [hash_token("abc12"), hash_token("def34")]
+
+    assert _use("abc12").email == EMAIL
+    assert secrets.twoFactorBackupCodes == [hash_token("def34")]
+
+    _assert_rejected("abc12")
+
+
+def test_legacy_plaintext_backup_code_is_accepted_once_and_removed(secrets):
+    secrets.twoFactorBackupCodes = ["abc12", hash_token("def34")]
+
+    assert _use("abc12").email == EMAIL
+    assert "abc12" not in secrets.twoFactorBackupCodes
+    assert secrets.twoFactorBackupCodes == [hash_token("def34")]
+
+    _assert_rejected("abc12")
+
+
+def test_unknown_backup_code_is_rejected(secrets):
+    secrets.twoFactorBackupCodes = [hash_token("abc12"), "def34"]
+
+    _assert_rejected("zzz99")
+    assert secrets.twoFactorBackupCodes == [hash_token("abc12"), "def34"]
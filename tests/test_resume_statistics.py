@@ -0,0 +1,43 @@
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import resume as resume_service
+
+
+@pytest.mark.parametrize("counter, other", [("views", "downloads"), ("downloads", "views")])
+def test_statistics_upsert_starts_only_the_counted_column_at_one(counter, other):
+    resume_id = uuid.uuid4()
+
+    compiled = resume_service._statistics_upsert(resume_id, counter).compile(dialect=postgresql.dialect())
+
+    assert compiled.params["resumeId"] == resume_id
+    assert compiled.params[counter] == 1
+    assert compiled.params[other] == 0
+    sql = str(compiled)
+    assert 'ON CONFLICT ("resumeId") DO UPDATE SET' in sql
+    assert f"{counter} = (statistics.{counter} + " in sql
+
+
+@pytest.mark.parametrize("counter", ["views", "downloads"])
+def test_increment_statistics_executes_and_commits(counter):
+    db = MagicMock()
+
+    resume_service._increment_statistics(db, uuid.uuid4(), counter)
+
+    db.execute.assert_called_once()
+    db.commit.assert_called_once()
+    db.rollback.assert_not_called()
+
+
+@pytest.mark.parametrize("counter", ["views", "downloads"])
+def test_increment_statistics_rolls_back_instead_of_raising(counter):
+    db = MagicMock()
+    db.execute.side_effect = RuntimeError("database is down")
+
+    resume_service._increment_statistics(db, uuid.uuid4(), counter)
+
+    db.commit.assert_not_called()
+    db.rollback.assert_called_once()